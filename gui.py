@@ -1,33 +1,48 @@
 import sys
-import pprint
-import json
 import os
-import csv
 import ast
-from typing import List, Optional
+import sqlite3
+from typing import Callable, Optional
+import numpy as np
 import pandas as pd
 import orjson
 import subprocess
+import selectors
+import time
+import multiprocessing
+import heapq
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from functools import lru_cache
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat, zip_longest
 
 
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
-
 from PySide6.QtCore import (
     Qt,
     QRect,
+    QRectF,
     QSize,
     QPoint,
     QTimer,
     Signal,
-    QObject,
     QEvent,
+    QFileSystemWatcher,
+    QStringListModel,
+    QLocale,
+)
+from PySide6.QtGui import (
+    QColor,
+    QDoubleValidator,
+    QFont,
+    QFontMetrics,
+    QIntValidator,
+    QPainter,
 )
 from PySide6.QtWidgets import (
     QApplication,
     QHBoxLayout,
-    QLayout,
-    QLayoutItem,
     QLabel,
     QLineEdit,
     QPushButton,
@@ -38,11 +53,14 @@ from PySide6.QtWidgets import (
     QWidget,
     QStackedWidget,
     QFrame,
-    QListWidget,
+    QListView,
+    QGridLayout,
+    QStyleOption,
 )
 
 from paths import (
     RECIPES_FOUND,
+    RECIPE_DB_CACHE,
     DISPLAY_CSV,
     SEARCH_CSV,
     INGRIDIENTS_TRIE,
@@ -50,16 +68,50 @@ from paths import (
     WEIGHTS
 )
 
-def _convert_sets_to_lists(obj):
-    if isinstance(obj, dict):
-        return {k: _convert_sets_to_lists(v) for k, v in obj.items()}
-    if isinstance(obj, set):
-        return sorted(list(obj))
-    return obj
+def _flatten_trie(word_ids: dict) -> dict:
+    """
+    Lays the trie out as flat arrays: sorted ``keys``, and the recipe ids
+    of ``keys[i]`` in ``ids[ids_off[i]:ids_off[i + 1]]``.
+    """
+    entries = sorted(word_ids.items(), key=lambda entry: entry[0])
+
+    # Ids were appended per occurrence; sort and dedupe once per word here.
+    per_word = [
+        np.unique(np.frombuffer(doc_ids, dtype=np.int64))
+        for _, doc_ids in entries
+    ]
+    ids_off = np.zeros(len(entries) + 1, dtype=np.int64)
+    np.cumsum([len(ids) for ids in per_word], out=ids_off[1:])
+    ids = np.concatenate(per_word) if per_word else np.zeros(0, np.int64)
+    return {
+        "keys": [word for word, _ in entries],
+        "ids_off": ids_off,
+        "ids": ids,
+    }
+
+# Below this many rows per worker, process start-up costs more than it saves.
+TRIE_SHARD_MIN_ROWS = 50_000
+
+def _build_word_ids(
+    doc_ids: np.ndarray, items_data: np.ndarray, separator: str
+) -> dict:
+    # Only whole words are ever looked up, so ids are keyed by word
+    # instead of walking one nested dict per character.
+    word_ids = {}
+    for doc_id, item_str in zip(doc_ids.tolist(), items_data):
+        for word in item_str.lower().split(separator):
+            word = word.strip()
+            if not word:
+                continue
+            ids = word_ids.get(word)
+            if ids is None:
+                word_ids[word] = ids = array("q")
+            ids.append(doc_id)
+    return word_ids
 
 def _create_trie_from_csv(
     source_csv: str,
-    output_json: str,
+    output_path: str,
     id_col: str,
     data_col: str,
     separator: str,
@@ -67,33 +119,248 @@ def _create_trie_from_csv(
     print("Reading CSV and preprocessing data...")
     df = pd.read_csv(source_csv, usecols=[id_col, data_col]).dropna()
 
-    doc_ids = df[id_col].tolist()
-    items_data = df[data_col].str.lower().tolist()
+    # Views onto the frame's columns; lower-casing happens per row in
+    # _build_word_ids rather than in a second full-size column copy.
+    doc_ids = df[id_col].to_numpy()
+    items_data = df[data_col].to_numpy()
     del df
 
     print("Building Trie...")
-    trie_root = {}
-    for doc_id, item_str in zip(doc_ids, items_data):
-        items = [x.strip() for x in item_str.split(separator) if x.strip()]
-        for word in items:
-            node = trie_root
-            for char in word:
-                node = node.setdefault(char, {})
-            node.setdefault("__ids__", set()).add(doc_id)
-
-    print("Converting sets to lists for serialization...")
-    trie_root = _convert_sets_to_lists(trie_root)
-
-    print(f"Writing Trie to {output_json}...")
-    os.makedirs(os.path.dirname(os.path.abspath(output_json)), exist_ok=True)
-    if orjson:
-        with open(output_json, 'wb') as f:
-            f.write(orjson.dumps(trie_root))
+    workers = min(os.cpu_count() or 1, len(doc_ids) // TRIE_SHARD_MIN_ROWS)
+    if workers > 1:
+        bounds = np.linspace(0, len(doc_ids), workers + 1, dtype=np.int64)
+        # Spawned rather than forked: the GUI process already runs Qt
+        # threads (and may call this from a worker thread), where fork can
+        # deadlock.
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=context
+        ) as pool:
+            parts = pool.map(
+                _build_word_ids,
+                [doc_ids[a:b] for a, b in zip(bounds, bounds[1:])],
+                [items_data[a:b] for a, b in zip(bounds, bounds[1:])],
+                repeat(separator, workers),
+            )
+            word_ids = {}
+            for part in parts:
+                for word, ids in part.items():
+                    merged = word_ids.get(word)
+                    if merged is None:
+                        word_ids[word] = ids
+                    else:
+                        merged.extend(ids)
     else:
-        with open(output_json, 'w', encoding='utf-8') as f:
-            json.dump(trie_root, f, separators=(',', ':'))
+        word_ids = _build_word_ids(doc_ids, items_data, separator)
+    del doc_ids, items_data
+
+    flat = _flatten_trie(word_ids)
+    del word_ids
+
+    print(f"Writing Trie to {output_path}...")
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    with open(output_path, "wb") as f:
+        np.savez(
+            f,
+            keys=np.array(flat["keys"], dtype=str),
+            ids_off=flat["ids_off"],
+            ids=flat["ids"],
+        )
     print("Trie generation complete.")
-    return trie_root
+    return flat
+
+def _read_csv_chunks(path: str, defaults: dict[str, str]):
+    """
+    Yields ``(ids, chunk)`` for each 50k-row chunk of ``path``. Values are
+    read as strings, rows without a numeric id are dropped and any column
+    in ``defaults`` missing from the file is filled with its default.
+    """
+    wanted = {"id", *defaults}
+    chunks = pd.read_csv(
+        path,
+        chunksize=50_000,
+        usecols=lambda col: col in wanted,
+        dtype=str,
+        keep_default_na=False,
+        engine="c",
+        memory_map=True,
+    )
+    for chunk in chunks:
+        ids = pd.to_numeric(chunk["id"], errors="coerce")
+        valid = ids.notna()
+        chunk = chunk[valid]
+        missing = {
+            col: default
+            for col, default in defaults.items()
+            if col not in chunk
+        }
+        if missing:
+            chunk = chunk.assign(**missing)
+        yield ids[valid].astype(np.int64).tolist(), chunk
+
+def _prefetched(iterable):
+    """
+    Yields from ``iterable`` while a worker thread already produces the
+    next item. pandas tokenizes and SQLite inserts with the GIL released,
+    so parsing one CSV chunk overlaps storing the previous one.
+    """
+    items = iter(iterable)
+    done = object()
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending = pool.submit(next, items, done)
+        while (item := pending.result()) is not done:
+            pending = pool.submit(next, items, done)
+            yield item
+
+def _mtime_ns(path: str) -> int:
+    """Modification time of ``path`` from a single stat, or 0 if missing."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+def _guarded_chunks(
+    path: str, defaults: dict[str, str], errors: list[Exception]
+):
+    """
+    Prefetched ``_read_csv_chunks`` of ``path``. Yields nothing if the file
+    is missing and stops, reporting the error and appending it to
+    ``errors``, if reading it fails.
+    """
+    if not os.path.exists(path):
+        return
+    try:
+        yield from _prefetched(_read_csv_chunks(path, defaults))
+    except Exception as e:
+        print(f"Error loading {os.path.basename(path)}: {e}")
+        errors.append(e)
+
+def _parse_list_cell(text: str) -> tuple:
+    """
+    Parses a list column of DISPLAY_CSV, or returns ``()`` if it is not a
+    list. Current exports store JSON, which orjson decodes directly; older
+    ones hold Python reprs and need ``ast.literal_eval``.
+    """
+    try:
+        try:
+            value = orjson.loads(text)
+        except orjson.JSONDecodeError:
+            value = ast.literal_eval(text)
+    except Exception:
+        return ()
+    return tuple(value) if isinstance(value, list) else ()
+
+@lru_cache(maxsize=128)
+def _ingredients_text(cell: str) -> str:
+    """Bulleted ingredient list for the detail view; ``""`` if empty."""
+    return "\n".join([f"• {item}" for item in _parse_list_cell(cell)])
+
+@lru_cache(maxsize=128)
+def _steps_text(cell: str) -> str:
+    """Numbered step list for the detail view; ``""`` if empty."""
+    steps = _parse_list_cell(cell)
+    return "\n".join([f"{i+1}. {step}" for i, step in enumerate(steps)])
+
+@lru_cache(maxsize=1024)
+def _result_stats_html(
+    accuracy: float, rating: str, minutes: str, cal: str, prot: str, fat: str
+) -> str:
+    """Rich text for a result card's stats column."""
+    if accuracy > 0.9:
+        acc_color = "#27ae60"
+    elif accuracy > 0.6:
+        acc_color = "#f39c12"
+    else:
+        acc_color = "#e74c3c"
+    return (
+        '<table cellspacing="0" cellpadding="2">'
+        f'<tr><td style="color: {acc_color};">'
+        f"Match: {accuracy * 100:.1f}%</td></tr>"
+        f"<tr><td>Rating: {rating}</td></tr>"
+        f"<tr><td>Time: {minutes} min</td></tr>"
+        f"<tr><td>Cal: {cal}</td></tr>"
+        f"<tr><td>Prot: {prot} g</td></tr>"
+        f"<tr><td>Fat: {fat} g</td></tr>"
+        "</table>"
+    )
+
+class RecipeDB:
+    """
+    Recipe fields kept in SQLite and fetched one id at a time, so only the
+    recipes on screen are ever turned into Python objects.
+    """
+
+    FIELDS = (
+        "name", "description", "steps", "ingredients",
+        "rating", "minutes", "cal", "prot", "fat",
+    )
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS recipes ("
+            "id INTEGER PRIMARY KEY, name TEXT, description TEXT, "
+            "steps TEXT, ingredients TEXT, rating REAL, "
+            "minutes TEXT, cal TEXT, prot TEXT, fat TEXT)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+        )
+        self._select = (
+            f"SELECT {', '.join(self.FIELDS)} FROM recipes WHERE id = ?"
+        )
+
+    def upsert(self, fields: tuple[str, ...], rows):
+        """
+        Writes ``(id, *values)`` rows. For an id that already exists only
+        ``fields`` are overwritten, so the two CSVs merge on id and a later
+        row wins over an earlier one.
+        """
+        updates = ", ".join(f"{field} = excluded.{field}" for field in fields)
+        self._conn.executemany(
+            f"INSERT INTO recipes (id, {', '.join(fields)}) "
+            f"VALUES ({', '.join('?' * (len(fields) + 1))}) "
+            f"ON CONFLICT(id) DO UPDATE SET {updates}",
+            rows,
+        )
+
+    def get_meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute(
+            "SELECT value FROM meta WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            (key, value),
+        )
+
+    def commit(self):
+        self._conn.commit()
+
+    def close(self):
+        self._conn.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM recipes").fetchone()[0]
+
+    def get(self, r_id, default: Optional[dict] = None) -> Optional[dict]:
+        """Returns the fields known for ``r_id`` as a dict, or ``default``."""
+        if not isinstance(r_id, int):
+            return default
+        row = self._conn.execute(self._select, (r_id,)).fetchone()
+        if row is None:
+            return default
+        entry = {
+            field: value
+            for field, value in zip(self.FIELDS, row)
+            if value is not None
+        }
+        if "rating" in entry:
+            entry["rating"] = f"{entry['rating']:.2f}"
+        return entry
 
 class TrieHandler:
     def __init__(
@@ -103,96 +370,167 @@ class TrieHandler:
         id_col: str = None,
         data_col: str = None,
         separator: str = ';',
+        background: bool = False,
     ):
         self.filepath = filepath
-        self.root = {}
-        self._load_or_generate(source_csv, id_col, data_col, separator)
+        # Set while a missing index is generated on a worker thread.
+        self._build: Optional[Future] = None
+        self.get_suggestions = lru_cache(maxsize=1024)(self.get_suggestions)
+        self.is_valid_ingredient = lru_cache(maxsize=4096)(
+            self.is_valid_ingredient
+        )
+        can_generate = source_csv and id_col and data_col
+        if background and can_generate and not os.path.exists(filepath):
+            flat = self._start_build(source_csv, id_col, data_col, separator)
+        else:
+            flat = self._load_or_generate(
+                source_csv, id_col, data_col, separator
+            )
+        self._set_flat(flat)
+
+    @property
+    def building(self) -> bool:
+        return self._build is not None
+
+    def _start_build(
+        self, source_csv: str, id_col: str, data_col: str, separator: str
+    ) -> dict:
+        """Starts generating the index and returns an empty one meanwhile."""
+        print(f"Trie file not found: {self.filepath}. Generating...")
+        pool = ThreadPoolExecutor(max_workers=1)
+        self._build = pool.submit(
+            _create_trie_from_csv,
+            source_csv=source_csv,
+            output_path=self.filepath,
+            id_col=id_col,
+            data_col=data_col,
+            separator=separator,
+        )
+        pool.shutdown(wait=False)
+        return {"keys": [], "ids_off": np.zeros(1, dtype=np.int64)}
+
+    def poll_build(self) -> bool:
+        """
+        Installs the index once a background build has finished. Returns
+        True when no build is pending any more.
+        """
+        if self._build is None:
+            return True
+        if not self._build.done():
+            return False
+        build, self._build = self._build, None
+        try:
+            self._set_flat(build.result())
+        except Exception as e:
+            print(f"Error generating Trie: {e}. Trie will be empty.")
+        return True
+
+    def _set_flat(self, flat: dict):
+        # Recipe count per ingredient, used to rank suggestions.
+        self._freq: dict[str, int] = {}
+        counts = np.diff(flat["ids_off"]).tolist()
+        for key, count in zip(flat["keys"], counts):
+            key = key.casefold()
+            self._freq[key] = self._freq.get(key, 0) + count
+        self._keys = tuple(sorted(self._freq))
+        # Keys under each two-character prefix, already in ranked order, so
+        # the shortest queried prefixes (the widest ranges) skip the ranking.
+        ranked = sorted(self._keys, key=self._freq.__getitem__, reverse=True)
+        pairs: dict[str, list[str]] = {}
+        for key in ranked:
+            if len(key) >= 2:
+                pairs.setdefault(key[:2], []).append(key)
+        self._by_pair = {pair: tuple(keys) for pair, keys in pairs.items()}
+        self.get_suggestions.cache_clear()
+        self.is_valid_ingredient.cache_clear()
 
     def _load_or_generate(
         self, source_csv: str, id_col: str, data_col: str, separator: str
-    ):
+    ) -> dict:
+        empty = {"keys": [], "ids_off": np.zeros(1, dtype=np.int64)}
         if os.path.exists(self.filepath):
             print(f"Loading Trie from {self.filepath}...")
             try:
-                if orjson:
-                    with open(self.filepath, "rb") as f:
-                        self.root = orjson.loads(f.read())
-                else:
-                    with open(self.filepath, "r", encoding="utf-8") as f:
-                        self.root = json.load(f)
+                # Members of the .npz are only read when accessed, so the
+                # ids buffer stays on disk.
+                with np.load(self.filepath) as data:
+                    return {
+                        "keys": data["keys"].tolist(),
+                        "ids_off": data["ids_off"],
+                    }
             except Exception as e:
                 print(f"Error loading Trie: {e}. Trie will be empty.")
-                self.root = {}
-            return
+                return empty
         if source_csv and id_col and data_col:
             print(f"Trie file not found: {self.filepath}. Generating...")
-            self.root = _create_trie_from_csv(
+            return _create_trie_from_csv(
                 source_csv=source_csv,
-                output_json=self.filepath,
+                output_path=self.filepath,
                 id_col=id_col,
                 data_col=data_col,
                 separator=separator,
             )
-        else:
-            print(f"Trie file not found: {self.filepath}. "
-                  "Generation arguments not provided. Trie will be empty.")
-
-    def get_suggestions(self, prefix: str, limit: int = 5) -> list[str]:
-        if not prefix or not self.root:
-            return []
-
-        prefix = prefix.lower()
-        node = self.root
-        for char in prefix:
-            if char not in node:
-                return []
-            node = node[char]
-        results = []
-        stack = [(node, prefix)]
-        while stack and len(results) < limit:
-            current_node, current_word = stack.pop()
-            if "__ids__" in current_node:
-                results.append(current_word)
-            for char, next_node in reversed(list(current_node.items())):
-                if char != "__ids__":
-                    stack.append((next_node, current_word + char))
-        return results
+        print(f"Trie file not found: {self.filepath}. "
+              "Generation arguments not provided. Trie will be empty.")
+        return empty
+
+    def prefix_keys(self, prefix: str, limit: Optional[int] = None) -> list[str]:
+        if len(prefix) == 2:
+            return list(self._by_pair.get(prefix, ())[:limit])
+        keys = self._keys
+        start = bisect_left(keys, prefix)
+        end = bisect_left(keys, prefix + chr(sys.maxunicode), start)
+        matches = keys[start:end]
+        if limit is not None and len(matches) > limit:
+            return heapq.nlargest(limit, matches, key=self._freq.__getitem__)
+        return sorted(matches, key=self._freq.__getitem__, reverse=True)
+
+    def get_suggestions(self, prefix: str, limit: int = 5) -> tuple[str, ...]:
+        prefix = prefix.lstrip().casefold()
+        if not prefix or not self._keys:
+            return ()
+        return tuple(self.prefix_keys(prefix, limit))
 
     def is_valid_ingredient(self, word: str) -> bool:
-        if not word or not self.root:
+        word = word.strip().casefold()
+        if not word:
             return False
-        node = self.root
-        for char in word.lower():
-            if char not in node:
-                return False
-            node = node[char]
-        return "__ids__" in node
-
-class FloatingList(QListWidget):
+        return word in self._freq
+
+class FloatingList(QListView):
     """
-    A custom list widget that floats, auto-scales height,
+    A custom list view that floats, auto-scales height,
     and scrolls if content exceeds MAX_HEIGHT.
     """
 
     MAX_HEIGHT = 200
+    ROW_HEIGHT = 30
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._model = QStringListModel(self)
+        self.setModel(self._model)
+        # Rows are single-line text, so one row's size holds for all, and
+        # only the rows that fit in MAX_HEIGHT need laying out up front.
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QListView.LayoutMode.Batched)
+        self.setBatchSize(self.MAX_HEIGHT // self.ROW_HEIGHT + 1)
+        self.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
         self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         self.setStyleSheet(
             """
-            QListWidget {
+            QListView {
                 background-color: white;
                 border: 1px solid #ccc;
                 font-size: 14px;
                 border-radius: 5px;
             }
-            QListWidget::item {
+            QListView::item {
                 padding: 5px;
                 color: black;
             }
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background-color: #0078d7;
                 color: white;
             }
@@ -200,14 +538,58 @@ class FloatingList(QListWidget):
         )
         self.hide()
 
+    def count(self) -> int:
+        return self._model.rowCount()
+
+    def currentRow(self) -> int:
+        return self.currentIndex().row()
+
+    def setCurrentRow(self, row: int):
+        self.setCurrentIndex(self._model.index(row))
+
+    def currentText(self) -> Optional[str]:
+        index = self.currentIndex()
+        return index.data() if index.isValid() else None
+
+    def _drop_rows_not_in(self, current: list[str], items) -> bool:
+        """
+        Removes the rows of ``current`` missing from ``items`` in place.
+        Only possible when ``items`` is a subsequence of ``current``, which
+        is the usual case while a prefix is being extended.
+        """
+        drop = []
+        j = 0
+        for row, text in enumerate(current):
+            if j < len(items) and text == items[j]:
+                j += 1
+            else:
+                drop.append(row)
+        if j < len(items):
+            return False
+        # Remove contiguous runs back to front so row numbers stay valid.
+        end = len(drop)
+        while end:
+            start = end - 1
+            while start and drop[start - 1] == drop[start] - 1:
+                start -= 1
+            self._model.removeRows(drop[start], end - start)
+            end = start
+        return True
+
     def update_items(self, items):
-        self.clear()
+        current = self._model.stringList()
+        if current != list(items):
+            # Several removeRows calls may run; repaint once at the end.
+            self.setUpdatesEnabled(False)
+            try:
+                if not self._drop_rows_not_in(current, items):
+                    self._model.setStringList(items)
+            finally:
+                self.setUpdatesEnabled(True)
         if not items:
             self.hide()
             return
-        self.addItems(items)
-        row_height = 30
-        total_content_height = len(items) * row_height + 5
+        total_content_height = len(items) * self.ROW_HEIGHT + 5
         final_height = min(total_content_height, self.MAX_HEIGHT)
 
         self.setFixedHeight(final_height)
@@ -227,57 +609,21 @@ class ClickableCard(QFrame):
             self.clicked.emit(self.recipe_id)
         super().mouseReleaseEvent(event)
 
-class BubbleWidget(QFrame):
-    def __init__(self, text: str, parent_area: "FlowScrollArea"):
-        super().__init__()
-        self._text = text
-        self._parent_area = parent_area
-        self.setObjectName("bubble")
-        self.setStyleSheet(
-            """
-            QFrame#bubble {
-                background-color: #e0e0e0;
-                border-radius: 15px;
-                border: 1px solid #ccc;
-            }
-            QLabel { color: #333; font-weight: 500; }
-            QPushButton {
-                background-color: transparent;
-                color: #555;
-                font-weight: bold;
-                border: none;
-                border-radius: 10px;
-            }
-            QPushButton:hover { background-color: #d0d0d0; color: red; }
-        """
-        )
-
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(10, 5, 10, 5)
-        layout.setSpacing(5)
-        lbl = QLabel(text)
-        layout.addWidget(lbl)
-        btn_close = QPushButton("✕")
-        btn_close.setFixedSize(20, 20)
-        btn_close.setCursor(Qt.CursorShape.PointingHandCursor)
-        btn_close.clicked.connect(self._remove_self)
-        layout.addWidget(btn_close)
-
-        self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-
-    def text(self) -> str:
-        return self._text
-
-    def _remove_self(self):
-        if self._parent_area:
-            self._parent_area.removeWidget(self)
-
 class AutocompleteLineEdit(QLineEdit):
+    SUGGESTION_LIMIT = 5
+    # One popup serves every field; the field that last queried owns it.
+    _shared_popup: Optional[FloatingList] = None
+    _popup_owner: Optional["AutocompleteLineEdit"] = None
+
     def __init__(self, trie_handler: TrieHandler, parent=None):
         super().__init__(parent)
         self.trie = trie_handler
         self.setPlaceholderText("Type ingredient...")
-        self.popup = None
+
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(80)
+        self._debounce.timeout.connect(self._run_query)
 
         self.textEdited.connect(self._on_text_edited)
         self.installEventFilter(self)
@@ -299,169 +645,297 @@ class AutocompleteLineEdit(QLineEdit):
                         self.popup.setCurrentRow(idx - 1)
                     return True
                 elif key == Qt.Key.Key_Enter or key == Qt.Key.Key_Return:
-                    if self.popup.currentItem():
-                        self._complete_text(self.popup.currentItem().text())
+                    current_text = self.popup.currentText()
+                    if current_text:
+                        self._complete_text(current_text)
                         return True
         return super().eventFilter(obj, event)
 
     def _on_text_edited(self, text):
-        if not self.popup:
-            self.popup = FloatingList(self.window())
-            self.popup.itemClicked.connect(self._on_item_clicked)
         if len(text) < 2:
-            self.popup.hide()
+            # Too short to query: hide now rather than after the debounce.
+            self._debounce.stop()
+            if self.popup:
+                self.popup.hide()
             return
+        self._debounce.start()
 
-        suggestions = self.trie.get_suggestions(text)
-        if not suggestions:
-            self.popup.hide()
+    @property
+    def popup(self) -> Optional[FloatingList]:
+        if AutocompleteLineEdit._popup_owner is self:
+            return AutocompleteLineEdit._shared_popup
+        return None
+
+    def _acquire_popup(self) -> FloatingList:
+        cls = AutocompleteLineEdit
+        popup = cls._shared_popup
+        if popup is None:
+            popup = FloatingList(self.window())
+            popup.clicked.connect(cls._on_shared_item_clicked)
+            popup.destroyed.connect(cls._forget_shared_popup)
+            cls._shared_popup = popup
+        elif popup.parentWidget() is not self.window():
+            popup.setParent(self.window())
+        cls._popup_owner = self
+        return popup
+
+    @staticmethod
+    def _on_shared_item_clicked(index):
+        owner = AutocompleteLineEdit._popup_owner
+        if owner is not None:
+            owner._on_item_clicked(index)
+
+    @staticmethod
+    def _forget_shared_popup():
+        AutocompleteLineEdit._shared_popup = None
+        AutocompleteLineEdit._popup_owner = None
+
+    def _run_query(self):
+        text = self.text()
+        popup = self._acquire_popup()
+        if len(text) < 2:
+            popup.hide()
             return
-        self.popup.update_items(suggestions)
-        self.popup.setCurrentRow(-1)
-        global_pos = self.mapToGlobal(QPoint(0, self.height()))
-        window_pos = self.window().mapFromGlobal(global_pos)
 
-        self.popup.move(window_pos)
-        self.popup.setFixedWidth(self.width())
+        suggestions = self.trie.get_suggestions(text, self.SUGGESTION_LIMIT)
+        if not suggestions:
+            popup.hide()
+            return
+        popup.update_items(suggestions)
+        popup.setCurrentRow(-1)
+        # Mapped within the window, so no round trip through screen coords.
+        popup.move(self.mapTo(popup.parentWidget(), QPoint(0, self.height())))
+        if popup.width() != self.width():
+            popup.setFixedWidth(self.width())
 
-    def _on_item_clicked(self, item):
-        self._complete_text(item.text())
+    def _on_item_clicked(self, index):
+        self._complete_text(index.data())
 
     def _complete_text(self, text):
+        self._debounce.stop()
         self.setText(text)
         if self.popup:
             self.popup.hide()
         self.setFocus()
 
     def focusOutEvent(self, event):
+        self._debounce.stop()
         if self.popup and not self.popup.hasFocus():
             self.popup.hide()
         super().focusOutEvent(event)
 
-class FlowLayout(QLayout):
-    def __init__(
-        self,
-        parent: Optional[QWidget] = None,
-        margin: int = 0,
-        h_spacing: int = -1,
-        v_spacing: int = -1,
-    ):
-        super().__init__(parent)
-        self._item_list: List[QLayoutItem] = []
-        self._h_space = h_spacing
-        self._v_space = v_spacing
-        self.setContentsMargins(margin, margin, margin, margin)
+class BubbleCanvas(QWidget):
+    """
+    Paints a list of strings as removable bubbles in a flow arrangement,
+    instead of keeping one child widget per bubble.
+    """
 
-    def __del__(self):
-        item = self.takeAt(0)
-        while item:
-            item = self.takeAt(0)
+    BUBBLE_HEIGHT = 30
+    PADDING_X = 10
+    CLOSE_SIZE = 20
+    INNER_SPACING = 5
+    RADIUS = 15
 
-    def addItem(self, item: QLayoutItem):
-        self._item_list.append(item)
+    def __init__(self, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self.items: list[str] = []
+        # Bubble widths, kept parallel to items so layout never re-measures.
+        self._widths: list[int] = []
+        self._rects: list[QRect] = []
+        # heightForWidth results by width; dropped whenever layout inputs change.
+        self._hfw_cache: dict[int, int] = {}
+        self._h_space = 10
+        self._v_space = 10
+        self._hover_index = -1
+        # 14px, as the QLabel rule in the main stylesheet gave the old
+        # bubble labels; the stylesheet has not reached this widget yet.
+        self._font = QFont(self.font())
+        self._font.setPixelSize(14)
+        self._font.setWeight(QFont.Weight.Medium)
+        self._metrics = QFontMetrics(self._font)
+        self._close_font = QFont(self.font())
+        self._close_font.setBold(True)
+        self.setMouseTracking(True)
+        policy = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+        policy.setHeightForWidth(True)
+        self.setSizePolicy(policy)
+
+    def add_item(self, text: str):
+        self.items.append(text)
+        self._widths.append(self._bubble_width(text))
+        self._items_changed()
+
+    def remove_at(self, index: int):
+        if 0 <= index < len(self.items):
+            del self.items[index]
+            del self._widths[index]
+            self._items_changed()
 
-    def count(self) -> int:
-        return len(self._item_list)
+    def clear(self):
+        if self.items:
+            self.items.clear()
+            self._widths.clear()
+            self._items_changed()
 
-    def itemAt(self, index: int) -> Optional[QLayoutItem]:
-        if 0 <= index < len(self._item_list):
-            return self._item_list[index]
-        return None
+    def set_spacing(self, h_spacing: int, v_spacing: int):
+        self._h_space = h_spacing
+        self._v_space = v_spacing
+        self._relayout()
+
+    def setContentsMargins(self, *margins):
+        super().setContentsMargins(*margins)
+        self._relayout()
+
+    def _items_changed(self):
+        self._hover_index = -1
+        self._relayout()
+
+    def _relayout(self):
+        self._hfw_cache.clear()
+        width = self.width()
+        # The pass that places the bubbles also answers the height query
+        # that updateGeometry() triggers for the current width.
+        self._rects, self._hfw_cache[width] = self._do_layout(width)
+        self.updateGeometry()
+        self.update()
+
+    def _bubble_width(self, text: str) -> int:
+        return (
+            self.PADDING_X * 2
+            + self._metrics.horizontalAdvance(text)
+            + self.INNER_SPACING
+            + self.CLOSE_SIZE
+        )
 
-    def takeAt(self, index: int) -> Optional[QLayoutItem]:
-        if 0 <= index < len(self._item_list):
-            return self._item_list.pop(index)
-        return None
+    def _do_layout(self, width: int) -> tuple[list[QRect], int]:
+        margins = self.contentsMargins()
+        x_start = margins.left()
+        x_end = width - margins.right()
+        x, y = x_start, margins.top()
+        line_height = 0
+        rects = []
+        for w in self._widths:
+            if x + w > x_end and line_height > 0:
+                x = x_start
+                y += line_height + self._v_space
+                line_height = 0
+            rects.append(QRect(x, y, w, self.BUBBLE_HEIGHT))
+            x += w + self._h_space
+            line_height = self.BUBBLE_HEIGHT
+        return rects, y + line_height + margins.bottom()
+
+    def _close_rect(self, rect: QRect) -> QRect:
+        return QRect(
+            rect.right() - self.PADDING_X - self.CLOSE_SIZE + 1,
+            rect.top() + (rect.height() - self.CLOSE_SIZE) // 2,
+            self.CLOSE_SIZE,
+            self.CLOSE_SIZE,
+        )
 
-    def expandingDirections(self) -> Qt.Orientation:
-        return Qt.Orientation(0)
+    def _close_index_at(self, pos: QPoint) -> int:
+        for index, rect in enumerate(self._rects):
+            if self._close_rect(rect).contains(pos):
+                return index
+        return -1
 
     def hasHeightForWidth(self) -> bool:
         return True
 
     def heightForWidth(self, width: int) -> int:
-        return self._do_layout(QRect(0, 0, width, 0), True)
-
-    def setGeometry(self, rect: QRect):
-        super().setGeometry(rect)
-        self._do_layout(rect, False)
+        height = self._hfw_cache.get(width)
+        if height is None:
+            height = self._hfw_cache[width] = self._do_layout(width)[1]
+        return height
 
     def sizeHint(self) -> QSize:
-        return self.minimumSize()
+        return QSize(self.width(), self.heightForWidth(self.width()))
+
+    def minimumSizeHint(self) -> QSize:
+        return QSize(0, 0)
+
+    def resizeEvent(self, event):
+        width = event.size().width()
+        self._rects, self._hfw_cache[width] = self._do_layout(width)
+        super().resizeEvent(event)
+
+    def mouseMoveEvent(self, event):
+        index = self._close_index_at(event.position().toPoint())
+        if index != self._hover_index:
+            self._hover_index = index
+            self.setCursor(
+                Qt.CursorShape.PointingHandCursor
+                if index >= 0
+                else Qt.CursorShape.ArrowCursor
+            )
+            self.update()
+        super().mouseMoveEvent(event)
 
-    def minimumSize(self) -> QSize:
-        size = QSize()
-        for item in self._item_list:
-            size = size.expandedTo(item.minimumSize())
-        margins = self.contentsMargins()
-        size += QSize(
-            margins.left() + margins.right(), margins.top() + margins.bottom()
-        )
-        return size
+    def leaveEvent(self, event):
+        if self._hover_index != -1:
+            self._hover_index = -1
+            self.unsetCursor()
+            self.update()
+        super().leaveEvent(event)
 
-    def getWidgets(self) -> List[QWidget]:
-        widgets = []
-        for item in self._item_list:
-            widget = item.widget()
-            if widget:
-                widgets.append(widget)
-        return widgets
-
-    def horizontalSpacing(self) -> int:
-        if self._h_space >= 0:
-            return self._h_space
-        return self.smartSpacing(QStyle.PM_LayoutHorizontalSpacing)
-
-    def verticalSpacing(self) -> int:
-        if self._v_space >= 0:
-            return self._v_space
-        return self.smartSpacing(QStyle.PM_LayoutVerticalSpacing)
-
-    def smartSpacing(self, pm: QStyle.PixelMetric) -> int:
-        parent = self.parent()
-        if not parent:
-            return -1
-        if parent.isWidgetType():
-            return parent.style().pixelMetric(pm, None, parent)
-        return QApplication.style().pixelMetric(pm, None, None)
-
-    def _do_layout(self, rect: QRect, test_only: bool) -> int:
-        left, top, right, bottom = self.getContentsMargins()
-        effective_rect = rect.adjusted(+left, +top, -right, -bottom)
-        x = effective_rect.x()
-        y = effective_rect.y()
-        line_height = 0
-        spacing_x = self.horizontalSpacing()
-        spacing_y = self.verticalSpacing()
-        if spacing_x == -1:
-            spacing_x = 10
-        if spacing_y == -1:
-            spacing_y = 10
-
-        for item in self._item_list:
-            next_x = x + item.sizeHint().width() + spacing_x
-            if (
-                next_x - spacing_x > effective_rect.right()
-                and line_height > 0
-            ):
-                x = effective_rect.x()
-                y = y + line_height + spacing_y
-                next_x = x + item.sizeHint().width() + spacing_x
-                line_height = 0
-            if not test_only:
-                item.setGeometry(QRect(QPoint(x, y), item.sizeHint()))
-            x = next_x
-            line_height = max(line_height, item.sizeHint().height())
-        return y + line_height - rect.y() + top + bottom
+    def mouseReleaseEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton:
+            index = self._close_index_at(event.position().toPoint())
+            if index >= 0:
+                self.remove_at(index)
+                self.unsetCursor()
+                return
+        super().mouseReleaseEvent(event)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        # Keep the stylesheet background (#flowContainer) for this subclass.
+        opt = QStyleOption()
+        opt.initFrom(self)
+        self.style().drawPrimitive(QStyle.PE_Widget, opt, painter, self)
+
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        for index, (text, rect) in enumerate(zip(self.items, self._rects)):
+            painter.setPen(QColor("#ccc"))
+            painter.setBrush(QColor("#e0e0e0"))
+            painter.drawRoundedRect(
+                QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5),
+                self.RADIUS,
+                self.RADIUS,
+            )
+
+            close_rect = self._close_rect(rect)
+            text_rect = QRect(
+                rect.left() + self.PADDING_X,
+                rect.top(),
+                close_rect.left() - self.INNER_SPACING
+                - rect.left() - self.PADDING_X,
+                rect.height(),
+            )
+            painter.setFont(self._font)
+            painter.setPen(QColor("#333"))
+            painter.drawText(
+                text_rect,
+                Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                text,
+            )
+
+            if index == self._hover_index:
+                painter.setPen(Qt.PenStyle.NoPen)
+                painter.setBrush(QColor("#d0d0d0"))
+                painter.drawEllipse(close_rect)
+                painter.setPen(QColor("red"))
+            else:
+                painter.setPen(QColor("#555"))
+            painter.setFont(self._close_font)
+            painter.drawText(close_rect, Qt.AlignmentFlag.AlignCenter, "✕")
 
 class FlowScrollArea(QScrollArea):
     def __init__(
         self, height: Optional[int] = 50, parent: Optional[QWidget] = None
     ):
         super().__init__(parent)
-        self._container = QWidget()
+        self._container = BubbleCanvas()
         self._container.setObjectName("flowContainer")
-        self._flow_layout = FlowLayout(self._container)
         self.setWidget(self._container)
         self.setWidgetResizable(True)
         self.setFrameShape(QScrollArea.NoFrame)
@@ -471,30 +945,24 @@ class FlowScrollArea(QScrollArea):
         self.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Maximum)
         self.updateGeometry()
 
-    def addWidget(self, widget: QWidget):
-        self._flow_layout.addWidget(widget)
+    @property
+    def items(self) -> list[str]:
+        return self._container.items
 
-    def getWidgets(self) -> List[QWidget]:
-        return self._flow_layout.getWidgets()
+    def addItem(self, text: str):
+        self._container.add_item(text)
 
-    def removeWidget(self, widget: QWidget):
-        self._flow_layout.removeWidget(widget)
-        widget.deleteLater()
+    def removeAt(self, index: int):
+        self._container.remove_at(index)
 
     def clear(self):
-        item = self._flow_layout.takeAt(0)
-        while item:
-            if item.widget():
-                item.widget().deleteLater()
-            item = self._flow_layout.takeAt(0)
+        self._container.clear()
 
     def setSpacing(self, h_spacing: int, v_spacing: int):
-        self._flow_layout._h_space = h_spacing
-        self._flow_layout._v_space = v_spacing
-        self._flow_layout.update()
+        self._container.set_spacing(h_spacing, v_spacing)
 
     def setContentsMargins(self, left: int, top: int, right: int, bottom: int):
-        self._flow_layout.setContentsMargins(left, top, right, bottom)
+        self._container.setContentsMargins(left, top, right, bottom)
 
     def sizeHint(self) -> QSize:
         inner_size = self._container.sizeHint()
@@ -502,33 +970,45 @@ class FlowScrollArea(QScrollArea):
         return QSize(super().sizeHint().width(), height)
 
 class Storage:
+    # Looked up along type(obj).__mro__, so subclasses resolve to their base.
+    _HANDLERS = {
+        QLineEdit: QLineEdit.text,
+        FlowScrollArea: lambda area: [item for item in area.items if item],
+        str: str,
+        int: str,
+    }
+
     def __init__(self) -> None:
         self._subscribers: list[tuple[str, object]] = []
+        # Handler resolved for each concrete type, so the MRO walk runs once.
+        self._resolved: dict[type, Optional[Callable]] = {}
 
     def add(self, key_name: str, object_instance: object):
         new_entry: tuple[str, object] = (key_name, object_instance)
         self._subscribers.append(new_entry)
 
+    def _handler_for(self, cls: type) -> Optional[Callable]:
+        try:
+            return self._resolved[cls]
+        except KeyError:
+            pass
+        handler = next(
+            (
+                self._HANDLERS[base]
+                for base in cls.__mro__
+                if base in self._HANDLERS
+            ),
+            None,
+        )
+        self._resolved[cls] = handler
+        return handler
+
     def _objects_to_dict(self) -> dict[str, str | list[str]]:
         def _object_to_data(object_instance: object) -> str | list[str]:
-            if hasattr(object_instance, "text"):
-                return object_instance.text()
-            match object_instance:
-                case str():
-                    return object_instance
-                case int():
-                    return str(object_instance)
-                case FlowScrollArea():
-                    items = []
-                    widgets = object_instance.getWidgets()
-                    for widget in widgets:
-                        item = _object_to_data(widget)
-                        if not item or item == "":
-                            continue
-                        items.append(item)
-                    return items
-                case _:
-                    return ""
+            handler = self._handler_for(type(object_instance))
+            if handler is not None:
+                return handler(object_instance)
+            return ""
 
         output: dict[str, str | list[str]] = {}
         for pair in self._subscribers:
@@ -554,47 +1034,138 @@ class Storage:
 
 storage = Storage()
 
-class RecipeFileHandler(QObject, FileSystemEventHandler):
-    file_changed = Signal()
-
-    def __init__(self, target_filename):
-        super().__init__()
-        self.target_filename = target_filename
-
-    def _process_event(self, event):
-        is_target = False
-        if hasattr(event, "dest_path"):
-            if os.path.basename(event.dest_path) == self.target_filename:
-                is_target = True
-
-        if os.path.basename(event.src_path) == self.target_filename:
-            is_target = True
-
-        if is_target:
-            self.file_changed.emit()
-
-    def on_modified(self, event):
-        self._process_event(event)
-
-    def on_created(self, event):
-        self._process_event(event)
-
-    def on_deleted(self, event):
-        self._process_event(event)
-
-    def on_moved(self, event):
-        self._process_event(event)
+_APP_QSS = """
+    QWidget#mainWindow {
+        background-color: #f0f2f5;
+    }
+    QLabel#appTitle1, QLabel#appTitle2 {
+        font-size: 28px;
+        font-weight: bold;
+        color: #2c3e50;
+    }
+    QLabel {
+        font-size: 14px;
+        color: #34495e;
+        font-weight: 500;
+    }
+
+    QLineEdit {
+        background-color: white;
+        border: 1px solid #bdc3c7;
+        border-radius: 5px;
+        padding: 8px;
+        font-size: 14px;
+    }
+    QScrollArea#leftMenuScrollArea {
+        border: none;
+    }
+    QWidget#flowContainer {
+        background-color: #f8f9fa;
+        border: 1px dashed #ccc;
+        border-radius: 5px;
+    }
+
+    QPushButton#searchButton {
+        background-color: #3498db;
+        color: white;
+        border: none;
+        border-radius: 5px;
+        padding: 12px;
+        font-size: 16px;
+        font-weight: bold;
+    }
+    QPushButton#searchButton:hover {
+        background-color: #2980b9;
+    }
+
+    QWidget#resultsPanel {
+        background-color: #ffffff;
+        border-left: 1px solid #e0e0e0;
+    }
+    QWidget#resultCard {
+        background-color: #f8f9fa;
+        border: 1px solid #d0d0d0;
+        border-radius: 12px;
+    }
+    QLabel#title {
+        font-size: 18px;
+        font-weight: bold;
+        color: #2c3e50;
+    }
+    QLabel#desc {
+        font-size: 13px;
+        color: #7f8c8d;
+    }
+    QLabel#stat {
+        font-size: 12px;
+        font-weight: bold;
+        color: #34495e;
+    }
+    QLabel#placeholder {
+        color: #888888;
+        font-size: 16px;
+        padding: 20px;
+    }
+    QLabel#sectionTitle {
+        font-size: 18px;
+        font-weight: bold;
+        margin-top: 20px;
+        color: #222;
+    }
+    QLabel#detailName {
+        font-size: 16px;
+    }
+    QLabel#detailList {
+        margin-left: 10px;
+        font-size: 14px;
+    }
+
+    QPushButton {
+        background-color: #e0e0e0;
+        border: 1px solid #ccc;
+        border-radius: 5px;
+        padding: 8px;
+        font-weight: 500;
+    }
+    QPushButton:hover {
+        background-color: #d0d0d0;
+    }
+"""
 
 class MainWindow(QWidget):
+    MIN_MAX_FILTERS = (
+        ("Rating (0-5)", "rating", 5, 2),
+        ("Time (Minutes)", "minutes", 10_000, 0),
+        ("Calories", "cal", 10_000, 0),
+        ("Protein (g)", "prot", 10_000, 1),
+        ("Fat (g)", "fat", 10_000, 1),
+    )
+    QUERY_CACHE_SIZE = 16
+    # Seconds to wait for a recipe_matcher --serve reply, including the
+    # SEARCH_CSV load that precedes the first one.
+    MATCHER_TIMEOUT = 10.0
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Wyszukiwarka Przepisów")
         self.setGeometry(100, 100, 1000, 700)
         self.setObjectName("mainWindow")
-        self.recipe_db = {}
+        self.recipe_db = RecipeDB()
+        self._db_loader = None
         self.current_results_ids = []
+        # Position of each result id in current_results_ids.
+        self.current_results_idx: dict[int, int] = {}
         self.current_accuracies = {}
         self.current_detail_id = None
+        # Raw bytes of the RECIPES_FOUND revision currently on screen.
+        self._shown_results: Optional[bytes] = None
+        self._card_pool: list[ClickableCard] = []
+        self._matcher: Optional[subprocess.Popen] = None
+        self._matcher_csv_mtime = 0
+        self._matcher_serve = True
+        self._query_cache: OrderedDict[
+            tuple[bytes, int, int], bytes
+        ] = OrderedDict()
 
         self._load_recipe_db()
         self.trie_handler = TrieHandler(
@@ -602,97 +1173,22 @@ class MainWindow(QWidget):
             SEARCH_CSV,
             "id",
             "ingredients_serialized",
-            ";"
+            ";",
+            background=True,
         )
+        # A cold start builds the ingredient index off the GUI thread;
+        # suggestions start once it is ready.
+        if self.trie_handler.building:
+            self._trie_poll = QTimer(self)
+            self._trie_poll.setInterval(100)
+            self._trie_poll.timeout.connect(self._poll_trie_build)
+            self._trie_poll.start()
 
         self._ui()
-        self._apply_stylesheet()
 
         self._setup_file_watcher()
         self.reload_results_from_file()
 
-    def _apply_stylesheet(self):
-        stylesheet = """
-            QWidget#mainWindow {
-                background-color: #f0f2f5;
-            }
-            QLabel#appTitle1, QLabel#appTitle2 {
-                font-size: 28px;
-                font-weight: bold;
-                color: #2c3e50;
-            }
-            QLabel {
-                font-size: 14px;
-                color: #34495e;
-                font-weight: 500;
-            }
-
-            QLineEdit {
-                background-color: white;
-                border: 1px solid #bdc3c7;
-                border-radius: 5px;
-                padding: 8px;
-                font-size: 14px;
-            }
-            QScrollArea#leftMenuScrollArea {
-                border: none;
-            }
-            QWidget#flowContainer {
-                background-color: #f8f9fa;
-                border: 1px dashed #ccc;
-                border-radius: 5px;
-            }
-
-            QPushButton#searchButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 12px;
-                font-size: 16px;
-                font-weight: bold;
-            }
-            QPushButton#searchButton:hover {
-                background-color: #2980b9;
-            }
-
-            QWidget#resultsPanel {
-                background-color: #ffffff;
-                border-left: 1px solid #e0e0e0;
-            }
-            QWidget#resultCard {
-                background-color: #f8f9fa;
-                border: 1px solid #d0d0d0;
-                border-radius: 12px;
-            }
-            QLabel#title {
-                font-size: 18px;
-                font-weight: bold;
-                color: #2c3e50;
-            }
-            QLabel#desc {
-                font-size: 13px;
-                color: #7f8c8d;
-            }
-            QLabel#stat, QLabel#matchStat {
-                font-size: 12px;
-                font-weight: bold;
-                color: #34495e;
-            }
-
-            QPushButton {
-                background-color: #e0e0e0;
-                border: 1px solid #ccc;
-                border-radius: 5px;
-                padding: 8px;
-                font-weight: 500;
-            }
-            QPushButton:hover {
-                background-color: #d0d0d0;
-            }
-        """
-        self.setStyleSheet(stylesheet)
-
     def _ui(self):
         self.stack = QStackedWidget(self)
         search_widget = QWidget()
@@ -748,8 +1244,12 @@ class MainWindow(QWidget):
         layout = QVBoxLayout(container)
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(15)
-        self.detail_header_container = QVBoxLayout()
-        layout.addLayout(self.detail_header_container)
+        self._detail_page = container
+        # Built once; _populate_detail_view only swaps the texts.
+        self.detail_header = self._create_result_widget(
+            {"id": None, "accuracy": 0.0}, clickable=False
+        )
+        layout.addWidget(self.detail_header)
         scroll = QScrollArea()
         scroll.setObjectName("leftMenuScrollArea")
         scroll.setWidgetResizable(True)
@@ -760,6 +1260,31 @@ class MainWindow(QWidget):
         self.detail_content_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
         self.detail_content_layout.setContentsMargins(10, 10, 10, 10)
 
+        def add_label(
+            text: str = "", object_name: str = "", word_wrap: bool = False
+        ) -> QLabel:
+            lbl = QLabel(text)
+            if object_name:
+                lbl.setObjectName(object_name)
+            lbl.setWordWrap(word_wrap)
+            self.detail_content_layout.addWidget(lbl)
+            return lbl
+
+        add_label("Name", "sectionTitle")
+        lbl_name = add_label(object_name="detailName", word_wrap=True)
+        add_label("Description", "sectionTitle")
+        lbl_desc = add_label(word_wrap=True)
+        add_label("Ingredients", "sectionTitle")
+        lbl_ing = add_label(object_name="detailList", word_wrap=True)
+        lbl_no_ing = add_label("No ingredients listed.")
+        add_label("Steps", "sectionTitle")
+        lbl_steps = add_label(object_name="detailList", word_wrap=True)
+        lbl_no_steps = add_label("No steps listed.")
+        self.detail_content_layout.addStretch()
+        self._detail_labels = (
+            lbl_name, lbl_desc, lbl_ing, lbl_no_ing, lbl_steps, lbl_no_steps
+        )
+
         scroll.setWidget(self.detail_content_widget)
         layout.addWidget(scroll, stretch=1)
         controls_widget = QWidget()
@@ -795,23 +1320,32 @@ class MainWindow(QWidget):
 
     def _ui_scrollable_menu(self) -> QScrollArea:
         content_widget = QWidget()
-        filter_menu = QVBoxLayout(content_widget)
-        filter_menu.setSpacing(15)
-        filter_menu.addWidget(self._ui_recipe_name())
-        filter_menu.addWidget(self._ui_liked_box())
-        filter_menu.addWidget(self._ui_disliked_box())
-
-        filter_menu.addSpacing(10)
-
-        filter_menu.addWidget(self._ui_min_max_input("Rating (0-5)", "rating"))
-        filter_menu.addWidget(
-            self._ui_min_max_input("Time (Minutes)", "minutes")
-        )
-        filter_menu.addWidget(self._ui_min_max_input("Calories", "cal"))
-        filter_menu.addWidget(self._ui_min_max_input("Protein (g)", "prot"))
-        filter_menu.addWidget(self._ui_min_max_input("Fat (g)", "fat"))
+        content_widget.setUpdatesEnabled(False)
+        try:
+            filter_menu = QVBoxLayout(content_widget)
+            filter_menu.setSpacing(15)
+            filter_menu.addWidget(self._ui_recipe_name())
+            filter_menu.addWidget(self._ui_liked_box())
+            filter_menu.addWidget(self._ui_disliked_box())
+
+            filter_menu.addSpacing(10)
+
+            min_max_grid = QGridLayout()
+            min_max_grid.setHorizontalSpacing(5)
+            min_max_grid.setVerticalSpacing(10)
+            for row, (label_text, key_prefix, top, decimals) in enumerate(
+                self.MIN_MAX_FILTERS
+            ):
+                row_widgets = self._ui_min_max_input(
+                    label_text, key_prefix, top, decimals
+                )
+                for col, widget in enumerate(row_widgets):
+                    min_max_grid.addWidget(widget, row, col)
+            filter_menu.addLayout(min_max_grid)
 
-        filter_menu.addStretch()
+            filter_menu.addStretch()
+        finally:
+            content_widget.setUpdatesEnabled(True)
 
         scrollable_menu = QScrollArea()
         scrollable_menu.setObjectName("leftMenuScrollArea")
@@ -819,17 +1353,10 @@ class MainWindow(QWidget):
         scrollable_menu.setWidgetResizable(True)
         return scrollable_menu
 
-    def _ui_min_max_input(self, label_text: str, key_prefix: str) -> QWidget:
-        container = QWidget()
-        layout = QVBoxLayout(container)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(5)
+    def _ui_min_max_input(
+        self, label_text: str, key_prefix: str, top: int, decimals: int = 0
+    ) -> tuple[QLabel, QLineEdit, QLabel, QLineEdit]:
         lbl = QLabel(label_text)
-        layout.addWidget(lbl)
-        row_widget = QWidget()
-        row_layout = QHBoxLayout(row_widget)
-        row_layout.setContentsMargins(0, 0, 0, 0)
-        row_layout.setSpacing(5)
         min_edit = QLineEdit()
         min_edit.setPlaceholderText("Min")
         storage.add(f"{key_prefix}_min", min_edit)
@@ -839,13 +1366,16 @@ class MainWindow(QWidget):
         max_edit.setPlaceholderText("Max")
         storage.add(f"{key_prefix}_max", max_edit)
 
-        row_layout.addWidget(min_edit)
-        row_layout.addWidget(sep)
-        row_layout.addWidget(max_edit)
-
-        layout.addWidget(row_widget)
+        if decimals:
+            validator = QDoubleValidator(0, top, decimals, min_edit)
+            validator.setNotation(QDoubleValidator.Notation.StandardNotation)
+        else:
+            validator = QIntValidator(0, top, min_edit)
+        validator.setLocale(QLocale.c())
+        min_edit.setValidator(validator)
+        max_edit.setValidator(validator)
 
-        return container
+        return lbl, min_edit, sep, max_edit
 
     def _ui_recipe_name(self) -> QWidget:
         output_widget = QWidget()
@@ -907,8 +1437,7 @@ class MainWindow(QWidget):
         def add_bubble():
             text = line_edit.text().strip()
             if text and self.trie_handler.is_valid_ingredient(text):
-                bubble = BubbleWidget(text, flow_area)
-                flow_area.addWidget(bubble)
+                flow_area.addItem(text)
                 line_edit.clear()
                 if line_edit.popup:
                     line_edit.popup.hide()
@@ -918,89 +1447,318 @@ class MainWindow(QWidget):
         line_edit.returnPressed.connect(add_bubble)
 
     def _load_recipe_db(self):
-        if os.path.exists(DISPLAY_CSV):
+        self._db_sources_mtime = ",".join(
+            str(_mtime_ns(path)) for path in (DISPLAY_CSV, SEARCH_CSV)
+        )
+        if os.path.exists(RECIPE_DB_CACHE):
             try:
-                with open(DISPLAY_CSV, mode="r", encoding="utf-8") as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        try:
-                            r_id = int(row["id"])
-                            if r_id not in self.recipe_db:
-                                self.recipe_db[r_id] = {}
-
-                            self.recipe_db[r_id]["name"] = row.get(
-                                "name", "Unknown"
-                            )
-                            self.recipe_db[r_id]["description"] = row.get(
-                                "description", ""
-                            )
-                            try:
-                                self.recipe_db[r_id]["steps"] = ast.literal_eval(
-                                    row.get("steps", "[]")
-                                )
-                            except:
-                                self.recipe_db[r_id]["steps"] = []
-
-                            try:
-                                self.recipe_db[r_id][
-                                    "ingredients"
-                                ] = ast.literal_eval(
-                                    row.get("ingredients", "[]")
-                                )
-                            except:
-                                self.recipe_db[r_id]["ingredients"] = []
-
-                        except ValueError:
-                            continue
-            except Exception as e:
-                print(f"Error loading DISPLAY_CSV: {e}")
-        if os.path.exists(SEARCH_CSV):
+                recipe_db = RecipeDB(RECIPE_DB_CACHE)
+                if recipe_db.get_meta("sources_mtime") == self._db_sources_mtime:
+                    self.recipe_db = recipe_db
+                    return
+                recipe_db.close()
+            except sqlite3.Error as e:
+                print(f"Error loading recipe cache: {e}")
+
+        # Build into a side file and swap it in once complete, so an
+        # interrupted import never looks like a valid cache.
+        self._db_build_path = RECIPE_DB_CACHE + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(RECIPE_DB_CACHE), exist_ok=True)
+            if os.path.exists(self._db_build_path):
+                os.remove(self._db_build_path)
+            build_db = RecipeDB(self._db_build_path)
+        except (OSError, sqlite3.Error) as e:
+            print(f"Error creating recipe cache: {e}")
+            self._db_build_path = None
+            build_db = RecipeDB()
+        # Parse one CSV chunk per event-loop turn so the window can paint
+        # and respond while a cold start reads the databases.
+        self._db_build = build_db
+        self._db_load_failed = False
+        self._db_loader = self._read_recipe_csvs(build_db)
+        QTimer.singleShot(0, self._load_next_recipe_chunk)
+
+    def _poll_trie_build(self):
+        if self.trie_handler.poll_build():
+            self._trie_poll.stop()
+
+    def _load_next_recipe_chunk(self):
+        if self._db_loader is None:
+            return
+        try:
+            next(self._db_loader)
+        except StopIteration:
+            self._db_loader = None
+            self._on_recipe_db_loaded()
+            return
+        QTimer.singleShot(0, self._load_next_recipe_chunk)
+
+    def _on_recipe_db_loaded(self):
+        build_db, self._db_build = self._db_build, None
+        # A partial import is only used for this session: without the meta
+        # stamp and the swap into RECIPE_DB_CACHE, the next start retries.
+        if not self._db_load_failed:
+            build_db.set_meta("sources_mtime", self._db_sources_mtime)
+        build_db.commit()
+        self.recipe_db = build_db
+        if self._db_build_path is not None and not self._db_load_failed:
             try:
-                with open(SEARCH_CSV, mode="r", encoding="utf-8") as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        try:
-                            r_id = int(row["id"])
-                            if r_id not in self.recipe_db:
-                                self.recipe_db[r_id] = {}
-
-                            raw_rating = row.get("avg_rating", "-")
-                            try:
-                                self.recipe_db[r_id]["rating"] = f"{float(raw_rating):.2f}"
-                            except (ValueError, TypeError):
-                                self.recipe_db[r_id]["rating"] = "-"
-
-                            self.recipe_db[r_id]["minutes"] = row.get(
-                                "minutes", "-"
-                            )
-                            self.recipe_db[r_id]["cal"] = row.get("cal", "-")
-                            self.recipe_db[r_id]["prot"] = row.get("prot", "-")
-                            self.recipe_db[r_id]["fat"] = row.get("fat", "-")
-                        except ValueError:
-                            continue
-            except Exception as e:
-                print(f"Error loading SEARCH_CSV: {e}")
+                build_db.close()
+                os.replace(self._db_build_path, RECIPE_DB_CACHE)
+                self.recipe_db = RecipeDB(RECIPE_DB_CACHE)
+            except (OSError, sqlite3.Error) as e:
+                print(f"Error writing recipe cache: {e}")
+                self.recipe_db = RecipeDB(self._db_build_path)
+
+        # Cards filled before the load show placeholder texts.
+        for card in (*self._card_pool, self.detail_header):
+            card.shown = None
+        if self.current_results_ids:
+            self.populate_results(
+                [
+                    {"id": r_id, "accuracy": self.current_accuracies.get(r_id, 0)}
+                    for r_id in self.current_results_ids
+                ]
+            )
+        if self.current_detail_id is not None:
+            self._populate_detail_view(self.current_detail_id)
+
+    def _read_recipe_csvs(self, recipe_db: RecipeDB):
+        """
+        Imports the CSVs into ``recipe_db``, yielding after every CSV chunk.
+        Sets ``self._db_load_failed`` if either file stopped on an error.
+        """
+        errors: list[Exception] = []
+        display_fields = ("name", "description", "steps", "ingredients")
+        search_fields = ("rating", "minutes", "cal", "prot", "fat")
+        display_chunks = _guarded_chunks(
+            DISPLAY_CSV,
+            {
+                "name": "Unknown",
+                "description": "",
+                "steps": "[]",
+                "ingredients": "[]",
+            },
+            errors,
+        )
+        search_chunks = _guarded_chunks(
+            SEARCH_CSV,
+            {
+                "avg_rating": "-",
+                "minutes": "-",
+                "cal": "-",
+                "prot": "-",
+                "fat": "-",
+            },
+            errors,
+        )
+        for display, search in zip_longest(display_chunks, search_chunks):
+            display_cols = search_cols = None
+            if display is not None:
+                ids, chunk = display
+                # steps/ingredients stay as text: they are only parsed
+                # when a recipe's detail view opens.
+                display_cols = [ids] + [
+                    chunk[field].tolist() for field in display_fields
+                ]
+            if search is not None:
+                ids, chunk = search
+                rating = pd.to_numeric(
+                    chunk["avg_rating"], errors="coerce"
+                ).to_numpy(dtype=np.float64)
+                search_cols = [ids, rating.tolist()] + [
+                    chunk[field].tolist() for field in search_fields[1:]
+                ]
+
+            # process_data.py writes both files in the same row order, so
+            # matching chunks normally go in as one merged row per recipe.
+            if display_cols and search_cols and display_cols[0] == search_cols[0]:
+                recipe_db.upsert(
+                    display_fields + search_fields,
+                    zip(*display_cols, *search_cols[1:]),
+                )
+            else:
+                if display_cols:
+                    recipe_db.upsert(display_fields, zip(*display_cols))
+                if search_cols:
+                    recipe_db.upsert(search_fields, zip(*search_cols))
+            yield
+        self._db_load_failed = bool(errors)
+
+    def _build_predicate_interval(
+        self, result_data: dict[str, str | list[str]]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the (min, max) bounds per filter and a per-filter flag for
+        entries outside 0..top. The validators only block typing invalid
+        characters; out-of-range numbers stay in the field as Intermediate.
+        """
+        interval = np.empty((len(self.MIN_MAX_FILTERS), 2))
+        interval[:, 0] = -np.inf
+        interval[:, 1] = np.inf
+        out_of_range = np.zeros(len(self.MIN_MAX_FILTERS), dtype=bool)
+        locale = QLocale.c()
+        for row, (_, key_prefix, top, _) in enumerate(self.MIN_MAX_FILTERS):
+            for col, suffix in enumerate(("min", "max")):
+                text = result_data.get(f"{key_prefix}_{suffix}", "")
+                if not text:
+                    continue
+                value, ok = locale.toDouble(text)
+                if ok and 0 <= value <= top:
+                    interval[row, col] = value
+                else:
+                    out_of_range[row] = True
+        return interval, out_of_range
+
+    def _filter_labels(self, rows: np.ndarray) -> str:
+        return ", ".join(
+            label_text
+            for (label_text, *_), flagged in zip(self.MIN_MAX_FILTERS, rows)
+            if flagged
+        )
 
     def on_search_press(self):
         result_data = storage.get_data()
-        pprint.pprint(result_data)
-        json_str = json.dumps(result_data, indent=4)
+        interval, out_of_range = self._build_predicate_interval(result_data)
+        if out_of_range.any():
+            labels = self._filter_labels(out_of_range)
+            self._show_placeholder(f"Value out of range for: {labels}")
+            return
+        empty_rows = interval[:, 0] > interval[:, 1]
+        if empty_rows.any():
+            labels = self._filter_labels(empty_rows)
+            self._show_placeholder(f"Min is greater than max for: {labels}")
+            return
+        # One key/array item per line: recipe_matcher parses line by line.
+        payload = orjson.dumps(
+            result_data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE,
+        )
 
-        with open(USER_OUTPUT, "w") as f:
-            f.write(json_str)
+        # Results depend on the recipes and weights as well as the query.
+        cache_key = (payload, _mtime_ns(WEIGHTS), _mtime_ns(SEARCH_CSV))
+        cached = self._query_cache.get(cache_key)
+        if cached is not None:
+            self._query_cache.move_to_end(cache_key)
+            with open(RECIPES_FOUND, "wb") as f:
+                f.write(cached)
+            return
+
+        with open(USER_OUTPUT, "wb") as f:
+            f.write(payload)
 
         try:
-            subprocess.run(["./recipe_matcher", USER_OUTPUT, SEARCH_CSV, RECIPES_FOUND, WEIGHTS])
+            if self._run_matcher():
+                with open(RECIPES_FOUND, "rb") as f:
+                    self._query_cache[cache_key] = f.read()
+                if len(self._query_cache) > self.QUERY_CACHE_SIZE:
+                    self._query_cache.popitem(last=False)
         except Exception as e:
             print(e)
 
+    def _run_matcher(self) -> bool:
+        """
+        Runs the query in USER_OUTPUT and reports whether RECIPES_FOUND was
+        written. Queries go to a long-lived ``recipe_matcher --serve``,
+        which keeps SEARCH_CSV parsed between searches. If the server does
+        not answer in time the query is run once on its own and the next
+        one starts a new server; a binary without server mode is always
+        run once per query.
+        """
+        if self._matcher_serve:
+            ok = self._query_matcher_server()
+            if ok is not None:
+                return ok
+        completed = subprocess.run(["./recipe_matcher", USER_OUTPUT, SEARCH_CSV, RECIPES_FOUND, WEIGHTS])
+        return completed.returncode == 0
+
+    def _query_matcher_server(self) -> Optional[bool]:
+        csv_mtime = _mtime_ns(SEARCH_CSV)
+        if self._matcher is not None and (
+            self._matcher.poll() is not None
+            or self._matcher_csv_mtime != csv_mtime
+        ):
+            self._stop_matcher()
+        if self._matcher is None:
+            try:
+                self._matcher = subprocess.Popen(
+                    ["./recipe_matcher", "--serve", SEARCH_CSV],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                )
+            except OSError as e:
+                print(f"recipe_matcher server unavailable: {e}")
+                return None
+            self._matcher_csv_mtime = csv_mtime
+        try:
+            self._matcher.stdin.write(
+                f"{USER_OUTPUT}\t{RECIPES_FOUND}\t{WEIGHTS}\n".encode()
+            )
+            self._matcher.stdin.flush()
+        except OSError:
+            # The server has exited; whatever it printed is read below.
+            pass
+        reply = self._read_matcher_reply()
+        if reply in ("ok", "error"):
+            return reply == "ok"
+        self._stop_matcher()
+        if reply:
+            # Builds without server mode print their usage instead.
+            print("recipe_matcher has no --serve mode, running it per query")
+            self._matcher_serve = False
+        else:
+            print("recipe_matcher server did not answer, restarting it")
+        return None
+
+    def _read_matcher_reply(self) -> str:
+        """
+        Reads one reply line from the matcher server. Returns ``""`` if the
+        server exits or MATCHER_TIMEOUT passes first.
+        """
+        fd = self._matcher.stdout.fileno()
+        deadline = time.monotonic() + self.MATCHER_TIMEOUT
+        reply = b""
+        with selectors.DefaultSelector() as selector:
+            selector.register(fd, selectors.EVENT_READ)
+            while not reply.endswith(b"\n"):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not selector.select(remaining):
+                    return ""
+                chunk = os.read(fd, 256)
+                if not chunk:
+                    return ""
+                reply += chunk
+        return reply.decode(errors="replace").strip()
+
+    def _stop_matcher(self):
+        proc, self._matcher = self._matcher, None
+        if proc is None:
+            return
+        for pipe in (proc.stdin, proc.stdout):
+            try:
+                pipe.close()
+            except OSError:
+                pass
+        try:
+            proc.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+    def closeEvent(self, event):
+        self._stop_matcher()
+        # An unfinished import is dropped; the next start replaces its
+        # side file.
+        self._db_loader = None
+        super().closeEvent(event)
+
     def _setup_file_watcher(self):
-        self.debounce_timer = QTimer()
+        self.debounce_timer = QTimer(self)
         self.debounce_timer.setSingleShot(True)
-        self.debounce_timer.setInterval(200)
+        self.debounce_timer.setInterval(50)
         self.debounce_timer.timeout.connect(self.reload_results_from_file)
         folder = os.path.dirname(RECIPES_FOUND)
-        filename = os.path.basename(RECIPES_FOUND)
 
         if not os.path.exists(folder):
             print(
@@ -1008,41 +1766,47 @@ class MainWindow(QWidget):
             )
             return
 
-        self.event_handler = RecipeFileHandler(filename)
-        self.event_handler.file_changed.connect(self.on_file_change_signal)
+        self._fs_watcher = QFileSystemWatcher([folder], self)
+        if os.path.exists(RECIPES_FOUND):
+            self._fs_watcher.addPath(RECIPES_FOUND)
+        self._fs_watcher.fileChanged.connect(self.on_file_change_signal)
+        self._fs_watcher.directoryChanged.connect(self._on_results_dir_changed)
 
-        self.observer = Observer()
-        self.observer.schedule(self.event_handler, folder, recursive=False)
-        self.observer.start()
-
-    def closeEvent(self, event):
-        if hasattr(self, "observer"):
-            self.observer.stop()
-            self.observer.join()
-        event.accept()
+    def _on_results_dir_changed(self, _path: str):
+        exists = os.path.exists(RECIPES_FOUND)
+        if exists and RECIPES_FOUND not in self._fs_watcher.files():
+            self._fs_watcher.addPath(RECIPES_FOUND)
+            self.debounce_timer.start()
+        elif not exists:
+            self.debounce_timer.start()
 
     def on_file_change_signal(self):
         self.debounce_timer.start()
 
     def reload_results_from_file(self):
-        if not os.path.exists(RECIPES_FOUND):
-            self._show_placeholder("File not found. Waiting for recipes...")
-            return
-
         try:
-            with open(RECIPES_FOUND, "r") as f:
-                content = f.read().strip()
-                if not content:
-                    self._show_placeholder("File is empty...")
-                    return
-                data = json.loads(content)
+            # Opening directly, rather than checking os.path.exists first,
+            # saves a stat and cannot race with the file being replaced.
+            with open(RECIPES_FOUND, "rb") as f:
+                content = f.read()
+            # The watcher fires several times per write; skip rebuilding
+            # the cards when the file still holds what is already shown.
+            if content == self._shown_results:
+                return
+            if not content or content.isspace():
+                self._show_placeholder("File is empty...")
+                return
+            data = orjson.loads(content)
             if not isinstance(data, list):
                 self._show_placeholder("Invalid data format: Expected a List")
                 return
 
             self.populate_results(data)
+            self._shown_results = content
 
-        except json.JSONDecodeError:
+        except FileNotFoundError:
+            self._show_placeholder("File not found. Waiting for recipes...")
+        except orjson.JSONDecodeError:
             pass
         except Exception as e:
             print(f"Error reading file: {e}")
@@ -1050,7 +1814,9 @@ class MainWindow(QWidget):
 
     def populate_results(self, results: list):
         self._clear_right_menu()
+        self._shown_results = None
         self.current_results_ids.clear()
+        self.current_results_idx.clear()
         self.current_accuracies.clear()
 
         valid_items_count = 0
@@ -1058,30 +1824,46 @@ class MainWindow(QWidget):
             self._show_placeholder("No matching recipes found")
             return
 
-        for data in results:
-            if not isinstance(data, dict):
-                continue
-            if "id" not in data or "accuracy" not in data:
-                continue
-
-            r_id = data.get("id")
-            accuracy = data.get("accuracy", 0.0)
-            self.current_results_ids.append(r_id)
-            self.current_accuracies[r_id] = accuracy
-            widget = self._create_result_widget(data)
-            self.right_menu_layout.addWidget(widget)
-            valid_items_count += 1
+        # One relayout and repaint for the whole refill, not per card.
+        self.results_panel.setUpdatesEnabled(False)
+        self.right_menu_layout.setEnabled(False)
+        try:
+            missing = object()
+            for data in results:
+                if not isinstance(data, dict):
+                    continue
+                r_id = data.get("id", missing)
+                accuracy = data.get("accuracy", missing)
+                if r_id is missing or accuracy is missing:
+                    continue
+
+                self.current_results_idx.setdefault(
+                    r_id, len(self.current_results_ids)
+                )
+                self.current_results_ids.append(r_id)
+                self.current_accuracies[r_id] = accuracy
+                if valid_items_count < len(self._card_pool):
+                    widget = self._card_pool[valid_items_count]
+                    self._fill_result_widget(widget, data)
+                else:
+                    widget = self._create_result_widget(data)
+                    self._card_pool.append(widget)
+                self.right_menu_layout.addWidget(widget)
+                widget.show()
+                valid_items_count += 1
 
-        self.right_menu_layout.addStretch()
+            self.right_menu_layout.addStretch()
+        finally:
+            self.right_menu_layout.setEnabled(True)
+            self.results_panel.setUpdatesEnabled(True)
 
     def _show_placeholder(self, message: str):
         self._clear_right_menu()
+        self._shown_results = None
 
         label = QLabel(message)
         label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        label.setStyleSheet(
-            "color: #888888; font-size: 16px; padding: 20px;"
-        )
+        label.setObjectName("placeholder")
 
         self.right_menu_layout.addWidget(label)
         self.right_menu_layout.addStretch()
@@ -1095,8 +1877,14 @@ class MainWindow(QWidget):
 
         while self.right_menu_layout.count():
             item = self.right_menu_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+            widget = item.widget()
+            if widget is None:
+                continue
+            # Pooled cards are only hidden so the next refresh can refill them.
+            if widget in self._card_pool:
+                widget.hide()
+            else:
+                widget.deleteLater()
 
     def _create_result_widget(
         self, data: dict, clickable: bool = True
@@ -1114,60 +1902,64 @@ class MainWindow(QWidget):
         main_layout.setContentsMargins(20, 15, 20, 15)
         main_layout.setSpacing(20)
 
-        db_entry = self.recipe_db.get(r_id, {})
-        name = db_entry.get("name", f"Unknown Recipe (ID: {r_id})")
-        desc = db_entry.get("description", "No description available.")
-        accuracy = data.get("accuracy", 0.0)
-        rating = db_entry.get("rating", "-")
-        minutes = db_entry.get("minutes", "-")
-        cal = db_entry.get("cal", "-")
-        prot = db_entry.get("prot", "-")
-        fat = db_entry.get("fat", "-")
         left_widget = QWidget()
         left_layout = QVBoxLayout(left_widget)
         left_layout.setContentsMargins(0, 0, 0, 0)
-        lbl_name = QLabel(name)
+        lbl_name = QLabel()
         lbl_name.setObjectName("title")
         lbl_name.setWordWrap(True)
-        lbl_desc = QLabel(desc)
+        lbl_desc = QLabel()
         lbl_desc.setObjectName("desc")
         lbl_desc.setWordWrap(True)
         lbl_desc.setAlignment(Qt.AlignmentFlag.AlignTop)
         left_layout.addWidget(lbl_name)
         left_layout.addWidget(lbl_desc, stretch=1)
-        right_widget = QWidget()
-        right_layout = QVBoxLayout(right_widget)
-        right_layout.setContentsMargins(0, 0, 0, 0)
-        right_widget.setFixedWidth(120)
-
-        acc_text = f"{accuracy * 100:.1f}%"
-        lbl_acc = QLabel(f"Match: {acc_text}")
-        lbl_acc.setObjectName("matchStat")
-        if accuracy > 0.9:
-            lbl_acc.setStyleSheet("color: #27ae60;")
-        elif accuracy > 0.6:
-            lbl_acc.setStyleSheet("color: #f39c12;")
-        else:
-            lbl_acc.setStyleSheet("color: #e74c3c;")
-
-        def make_stat_row(label, value):
-            l = QLabel(f"{label}: {value}")
-            l.setObjectName("stat")
-            return l
-
-        right_layout.addWidget(lbl_acc)
-        right_layout.addWidget(make_stat_row("Rating", rating))
-        right_layout.addWidget(make_stat_row("Time", f"{minutes} min"))
-        right_layout.addWidget(make_stat_row("Cal", cal))
-        right_layout.addWidget(make_stat_row("Prot", f"{prot} g"))
-        right_layout.addWidget(make_stat_row("Fat", f"{fat} g"))
-        right_layout.addStretch()
+        # All stats share one rich-text label; a label per row costs far
+        # more to create and lay out than it renders.
+        lbl_stats = QLabel()
+        lbl_stats.setObjectName("stat")
+        lbl_stats.setTextFormat(Qt.TextFormat.RichText)
+        lbl_stats.setAlignment(Qt.AlignmentFlag.AlignTop)
+        lbl_stats.setFixedWidth(120)
 
         main_layout.addWidget(left_widget, stretch=3)
-        main_layout.addWidget(right_widget, stretch=1)
+        main_layout.addWidget(lbl_stats, stretch=1)
 
+        card.labels = (lbl_name, lbl_desc, lbl_stats)
+        card.shown = None
+        self._fill_result_widget(card, data)
         return card
 
+    def _fill_result_widget(self, card: QWidget, data: dict):
+        """Writes one result's texts into a card built by
+        ``_create_result_widget``."""
+        r_id = data.get("id")
+        accuracy = data.get("accuracy", 0.0)
+        # Most reloads keep the same results in the same order, so a card
+        # that already shows this one needs no lookup or relayout.
+        if card.shown == (r_id, accuracy):
+            return
+        card.shown = (r_id, accuracy)
+        if isinstance(card, ClickableCard):
+            card.recipe_id = r_id
+
+        db_entry = self.recipe_db.get(r_id, {})
+        name = db_entry.get("name", f"Unknown Recipe (ID: {r_id})")
+        desc = db_entry.get("description", "No description available.")
+        rating = db_entry.get("rating", "-")
+        minutes = db_entry.get("minutes", "-")
+        cal = db_entry.get("cal", "-")
+        prot = db_entry.get("prot", "-")
+        fat = db_entry.get("fat", "-")
+
+        lbl_name, lbl_desc, lbl_stats = card.labels
+        lbl_name.setText(name)
+        lbl_desc.setText(desc)
+
+        lbl_stats.setText(
+            _result_stats_html(accuracy, rating, minutes, cal, prot, fat)
+        )
+
     def open_detail_view(self, r_id: int):
         self.current_detail_id = r_id
         self._populate_detail_view(r_id)
@@ -1180,87 +1972,60 @@ class MainWindow(QWidget):
         if not self.current_detail_id or not self.current_results_ids:
             return
         try:
-            curr_idx = self.current_results_ids.index(self.current_detail_id)
+            curr_idx = self.current_results_idx[self.current_detail_id]
             next_idx = (curr_idx + 1) % len(
                 self.current_results_ids
             )
             next_id = self.current_results_ids[next_idx]
             self.open_detail_view(next_id)
-        except ValueError:
+        except KeyError:
             pass
 
     def action_prev_recipe(self):
         if not self.current_detail_id or not self.current_results_ids:
             return
         try:
-            curr_idx = self.current_results_ids.index(self.current_detail_id)
+            curr_idx = self.current_results_idx[self.current_detail_id]
             prev_idx = (curr_idx - 1) % len(
                 self.current_results_ids
             )
             prev_id = self.current_results_ids[prev_idx]
             self.open_detail_view(prev_id)
-        except ValueError:
+        except KeyError:
             pass
 
     def _populate_detail_view(self, r_id: int):
-        while self.detail_header_container.count():
-            item = self.detail_header_container.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        while self.detail_content_layout.count():
-            item = self.detail_content_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        accuracy = self.current_accuracies.get(r_id, 0.0)
-        data_packet = {"id": r_id, "accuracy": accuracy}
-
-        header_card = self._create_result_widget(data_packet, clickable=False)
-        self.detail_header_container.addWidget(header_card)
-        db_data = self.recipe_db.get(r_id, {})
-
-        def add_section_title(text):
-            lbl = QLabel(text)
-            lbl.setStyleSheet(
-                "font-size: 18px; font-weight: bold; margin-top: 20px; color: #222;"
-            )
-            self.detail_content_layout.addWidget(lbl)
-        add_section_title("Name")
-        lbl_name = QLabel(db_data.get("name", ""))
-        lbl_name.setStyleSheet("font-size: 16px;")
-        lbl_name.setWordWrap(True)
-        self.detail_content_layout.addWidget(lbl_name)
-        add_section_title("Description")
-        lbl_desc = QLabel(db_data.get("description", ""))
-        lbl_desc.setWordWrap(True)
-        self.detail_content_layout.addWidget(lbl_desc)
-        add_section_title("Ingredients")
-        ingredients = db_data.get("ingredients", [])
-        if ingredients:
-            ing_text = "\n".join([f"• {item}" for item in ingredients])
-            lbl_ing = QLabel(ing_text)
-            lbl_ing.setWordWrap(True)
-            lbl_ing.setStyleSheet("margin-left: 10px; font-size: 14px;")
-            self.detail_content_layout.addWidget(lbl_ing)
-        else:
-            self.detail_content_layout.addWidget(QLabel("No ingredients listed."))
-        add_section_title("Steps")
-        steps = db_data.get("steps", [])
-        if steps:
-            steps_text = "\n".join(
-                [f"{i+1}. {step}" for i, step in enumerate(steps)]
-            )
-            lbl_steps = QLabel(steps_text)
-            lbl_steps.setWordWrap(True)
-            lbl_steps.setStyleSheet("margin-left: 10px; font-size: 14px; line-height: 150%;")
-            self.detail_content_layout.addWidget(lbl_steps)
-        else:
-            self.detail_content_layout.addWidget(QLabel("No steps listed."))
-
-        self.detail_content_layout.addStretch()
+        # Relayout and repaint once for the whole refill, not per label.
+        self._detail_page.setUpdatesEnabled(False)
+        try:
+            accuracy = self.current_accuracies.get(r_id, 0.0)
+            data_packet = {"id": r_id, "accuracy": accuracy}
+            self._fill_result_widget(self.detail_header, data_packet)
+            db_data = self.recipe_db.get(r_id, {})
+
+            (
+                lbl_name, lbl_desc, lbl_ing, lbl_no_ing, lbl_steps, lbl_no_steps
+            ) = self._detail_labels
+            lbl_name.setText(db_data.get("name", ""))
+            lbl_desc.setText(db_data.get("description", ""))
+
+            ingredients = _ingredients_text(db_data.get("ingredients", "[]"))
+            lbl_ing.setText(ingredients)
+            lbl_ing.setVisible(bool(ingredients))
+            lbl_no_ing.setVisible(not ingredients)
+
+            steps = _steps_text(db_data.get("steps", "[]"))
+            lbl_steps.setText(steps)
+            lbl_steps.setVisible(bool(steps))
+            lbl_no_steps.setVisible(not steps)
+        finally:
+            self._detail_page.setUpdatesEnabled(True)
 
 def main():
     app = QApplication(sys.argv)
+    # Applied once at application level, so widgets created later are
+    # polished as they appear instead of re-polishing the window tree.
+    app.setStyleSheet(_APP_QSS)
     window = MainWindow()
     window.show()
     sys.exit(app.exec())
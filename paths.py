@@ -4,8 +4,9 @@ SEARCH_CSV = os.path.abspath("./data/processed/search_db.csv")
 DISPLAY_CSV = os.path.abspath("./data/processed/display_db.csv")
 WEIGHTS = os.path.abspath("./weights.conf")
 
-INGRIDIENTS_TRIE = os.path.join(CACHE_PATH, "ingredients_trie.json")
+INGRIDIENTS_TRIE = os.path.join(CACHE_PATH, "ingredients_trie.npz")
 RECIPES_FOUND = os.path.join(CACHE_PATH, "recipes_found.json")
+RECIPE_DB_CACHE = os.path.join(CACHE_PATH, "recipe_db.sqlite")
 USER_OUTPUT = os.path.join(CACHE_PATH, "input.json")
 
 
@@ -1,5 +1,6 @@
 import pandas as pd
 import ast
+import json
 import os
 import re
 import sys
@@ -82,6 +83,17 @@ def clean_list_string(str_list):
 recipes['ingredients_serialized'] = recipes['ingredients'].apply(clean_list_string)
 recipes['tags_serialized'] = recipes['tags'].apply(clean_list_string)
 recipes['name_clean'] = recipes['name'].astype(str).str.replace(';', '').str.replace(',', '')
+
+def list_to_json(str_list):
+    # The GUI parses these columns with orjson, which is far cheaper than
+    # ast.literal_eval.
+    try:
+        return json.dumps(ast.literal_eval(str_list), ensure_ascii=False)
+    except:
+        return "[]"
+
+recipes['steps'] = recipes['steps'].apply(list_to_json)
+recipes['ingredients'] = recipes['ingredients'].apply(list_to_json)
 print("Sorting and Exporting...")
 recipes.sort_values(by='review_count', ascending=False, inplace=True)
 search_columns = [
@@ -3,6 +3,7 @@
 #include <stdio.h>
 #include <stdlib.h>
 #include <string.h>
+#include <unistd.h>
 
 #define MAX_LINE 16384
 #define MAX_INGREDIENTS 100
@@ -39,21 +40,35 @@ typedef struct {
   int disliked_count;
 } Preferences;
 
+// Kolumny liczbowe przechowywane osobno (SoA), żeby sprawdzanie zakresów
+// szło jedną ciasną pętlą po każdej kolumnie.
+typedef struct {
+  int count;
+  int capacity;
+  int *id;
+  float *avg_rating;
+  int *minutes;
+  float *cal;
+  float *prot;
+  float *fat;
+  float *score;
+  // Zakres każdej kolumny, liczony raz w load_recipes.
+  float avg_rating_min, avg_rating_max;
+  int minutes_min, minutes_max;
+  float cal_min, cal_max;
+  float prot_min, prot_max;
+  float fat_min, fat_max;
+  // Tekst trzymany tylko gdy zapytania go potrzebują (tryb --serve albo
+  // zapytanie z nazwą/składnikami).
+  char **name;
+  char **ingredients; // Składniki jednego przepisu rozdzielone '\0'
+  int *ingredients_count;
+} RecipeColumns;
+
 typedef struct {
   int id;
-  float avg_rating;
-  int review_count;
-  int minutes;
-  float cal;
-  float prot;
-  float fat;
-  char name_clean[MAX_NAME];
-  char **ingredients;
-  int ingredients_count;
-  char **tags;
-  int tags_count;
   float accuracy;
-} Recipe;
+} Match;
 
 // --- Helpers ---
 
@@ -90,12 +105,32 @@ void free_string_array(char **arr, int count) {
   free(arr);
 }
 
+// Składniki w jednym buforze zamiast osobnego malloca na każdy napis.
+char *pack_ingredients(char *str, int *count) {
+  char **parts = split_string(str, ";", count);
+  size_t size = 1;
+  for (int i = 0; i < *count; i++)
+    size += strlen(parts[i]) + 1;
+  char *packed = malloc(size);
+  char *p = packed;
+  for (int i = 0; i < *count; i++) {
+    size_t len = strlen(parts[i]) + 1;
+    memcpy(p, parts[i], len);
+    p += len;
+  }
+  *p = '\0';
+  free_string_array(parts, *count);
+  return packed;
+}
+
 // Case insensitive search (non-standard in strict ANSI, common in POSIX)
-int contains_ingredient(char **ingredients, int count, const char *search) {
+int contains_ingredient(const char *ingredients, int count,
+                        const char *search) {
   for (int i = 0; i < count; i++) {
-    if (strcasestr(ingredients[i], search) != NULL) {
+    if (strcasestr(ingredients, search) != NULL) {
       return 1;
     }
+    ingredients += strlen(ingredients) + 1;
   }
   return 0;
 }
@@ -152,77 +187,136 @@ void load_weights(const char *filename, Weights *w) {
   printf("✓ Załadowano wagi z %s\n", filename);
 }
 
-float calculate_accuracy(Recipe *recipe, Preferences *prefs, Weights *w) {
-  float score = 0.0;
-  float total_possible_score = 0.0;
-
-  // 1. Nazwa przepisu (Name Match)
-  // Only check if user actually provided a name to search for
-  if (strlen(prefs->recipe_name) > 0) {
-    total_possible_score += w->w_name;
-    if (strcasestr(recipe->name_clean, prefs->recipe_name) != NULL) {
-      score += w->w_name;
-    }
-  }
-
-  // 2. Czas (Time)
-  total_possible_score += w->w_minutes;
-  if (recipe->minutes >= prefs->minutes_min &&
-      recipe->minutes <= prefs->minutes_max) {
-    score += w->w_minutes;
-  }
+void columns_init(RecipeColumns *c, int capacity) {
+  c->count = 0;
+  c->capacity = capacity;
+  c->id = malloc(capacity * sizeof(int));
+  c->avg_rating = malloc(capacity * sizeof(float));
+  c->minutes = malloc(capacity * sizeof(int));
+  c->cal = malloc(capacity * sizeof(float));
+  c->prot = malloc(capacity * sizeof(float));
+  c->fat = malloc(capacity * sizeof(float));
+  c->score = malloc(capacity * sizeof(float));
+  c->name = malloc(capacity * sizeof(char *));
+  c->ingredients = malloc(capacity * sizeof(char *));
+  c->ingredients_count = malloc(capacity * sizeof(int));
+}
 
-  // 3. Makroskładniki
-  total_possible_score += w->w_cal;
-  if (recipe->cal >= prefs->cal_min && recipe->cal <= prefs->cal_max)
-    score += w->w_cal;
+void columns_grow(RecipeColumns *c) {
+  c->capacity *= 2;
+  c->id = realloc(c->id, c->capacity * sizeof(int));
+  c->avg_rating = realloc(c->avg_rating, c->capacity * sizeof(float));
+  c->minutes = realloc(c->minutes, c->capacity * sizeof(int));
+  c->cal = realloc(c->cal, c->capacity * sizeof(float));
+  c->prot = realloc(c->prot, c->capacity * sizeof(float));
+  c->fat = realloc(c->fat, c->capacity * sizeof(float));
+  c->score = realloc(c->score, c->capacity * sizeof(float));
+  c->name = realloc(c->name, c->capacity * sizeof(char *));
+  c->ingredients = realloc(c->ingredients, c->capacity * sizeof(char *));
+  c->ingredients_count =
+      realloc(c->ingredients_count, c->capacity * sizeof(int));
+}
 
-  total_possible_score += w->w_fat;
-  if (recipe->fat >= prefs->fat_min && recipe->fat <= prefs->fat_max)
-    score += w->w_fat;
+float total_possible_score(Preferences *prefs, Weights *w) {
+  float total = w->w_minutes + w->w_cal + w->w_fat + w->w_prot + w->w_rating;
+  if (strlen(prefs->recipe_name) > 0)
+    total += w->w_name;
+  total += prefs->liked_count * w->w_liked;
+  total += prefs->disliked_count * w->w_disliked;
+  return total;
+}
 
-  total_possible_score += w->w_prot;
-  if (recipe->prot >= prefs->prot_min && recipe->prot <= prefs->prot_max)
-    score += w->w_prot;
+// Nazwa i składniki - liczone od razu przy wczytywaniu wiersza
+float score_text_criteria(const char *name_clean, const char *ingredients,
+                          int ingredients_count, Preferences *prefs,
+                          Weights *w) {
+  float score = 0.0;
 
-  // 4. Ocena
-  total_possible_score += w->w_rating;
-  if (recipe->avg_rating >= prefs->rating_min &&
-      recipe->avg_rating <= prefs->rating_max) {
-    score += w->w_rating;
+  // 1. Nazwa przepisu (Name Match)
+  // Only check if user actually provided a name to search for
+  if (prefs->recipe_name[0] != '\0' &&
+      strcasestr(name_clean, prefs->recipe_name) != NULL) {
+    score += w->w_name;
   }
 
   // 5. Lubiane składniki (Add points for presence)
-  if (prefs->liked_count > 0) {
-    for (int i = 0; i < prefs->liked_count; i++) {
-      total_possible_score += w->w_liked;
-      if (contains_ingredient(recipe->ingredients, recipe->ingredients_count,
-                              prefs->ingredients_liked[i])) {
-        score += w->w_liked;
-      }
+  for (int i = 0; i < prefs->liked_count; i++) {
+    if (contains_ingredient(ingredients, ingredients_count,
+                            prefs->ingredients_liked[i])) {
+      score += w->w_liked;
     }
   }
 
   // 6. Nielubiane składniki (Add points for absence)
-  if (prefs->disliked_count > 0) {
-    for (int i = 0; i < prefs->disliked_count; i++) {
-      total_possible_score += w->w_disliked;
-      // Success means NOT containing the ingredient
-      if (!contains_ingredient(recipe->ingredients, recipe->ingredients_count,
-                               prefs->ingredients_disliked[i])) {
-        score += w->w_disliked;
-      }
+  for (int i = 0; i < prefs->disliked_count; i++) {
+    // Success means NOT containing the ingredient
+    if (!contains_ingredient(ingredients, ingredients_count,
+                             prefs->ingredients_disliked[i])) {
+      score += w->w_disliked;
     }
   }
 
-  return total_possible_score > 0 ? score / total_possible_score : 0.0;
+  return score;
 }
 
-void parse_preferences(const char *filename, Preferences *prefs) {
+// Jeden wymiar zakresu. Zwraca punkty należne każdemu przepisowi bez
+// porównywania: cały zakres kolumny mieści się w [lo, hi] -> weight,
+// pusty zakres (lo > hi) -> 0. W pozostałych przypadkach dolicza punkty
+// do score[i] jedną pętlą bez rozgałęzień, porównując tylko te granice,
+// które faktycznie obcinają kolumnę.
+// Ta sama treść dla kolumn float i int; col_min/col_max pochodzą z
+// RecipeColumns, więc zapytanie nie skanuje kolumny drugi raz.
+#define DEFINE_SCORE_RANGE(fn, type)                                           \
+  float fn(const type *col, int n, type col_min, type col_max, type lo,        \
+           type hi, float weight, float *score) {                              \
+    if (n == 0 || lo > hi)                                                     \
+      return 0.0;                                                              \
+    int need_lo = lo > col_min, need_hi = hi < col_max;                        \
+    if (!need_lo && !need_hi)                                                  \
+      return weight;                                                           \
+    if (!need_hi)                                                              \
+      for (int i = 0; i < n; i++)                                              \
+        score[i] += weight * (col[i] >= lo);                                   \
+    else if (!need_lo)                                                         \
+      for (int i = 0; i < n; i++)                                              \
+        score[i] += weight * (col[i] <= hi);                                   \
+    else                                                                       \
+      for (int i = 0; i < n; i++)                                              \
+        score[i] += weight * (col[i] >= lo && col[i] <= hi);                   \
+    return 0.0;                                                                \
+  }
+
+DEFINE_SCORE_RANGE(score_float_range, float)
+DEFINE_SCORE_RANGE(score_int_range, int)
+
+// Zakresy liczbowe (2. Czas, 3. Makroskładniki, 4. Ocena) - jedna pętla na
+// kolumnę (SoA). Zwraca punkty wspólne dla wszystkich przepisów.
+float score_range_criteria(RecipeColumns *c, Preferences *prefs, Weights *w) {
+  int n = c->count;
+  float shared = 0.0;
+  shared += score_int_range(c->minutes, n, c->minutes_min, c->minutes_max,
+                            prefs->minutes_min, prefs->minutes_max,
+                            w->w_minutes, c->score);
+  shared += score_float_range(c->cal, n, c->cal_min, c->cal_max,
+                              prefs->cal_min, prefs->cal_max, w->w_cal,
+                              c->score);
+  shared += score_float_range(c->fat, n, c->fat_min, c->fat_max,
+                              prefs->fat_min, prefs->fat_max, w->w_fat,
+                              c->score);
+  shared += score_float_range(c->prot, n, c->prot_min, c->prot_max,
+                              prefs->prot_min, prefs->prot_max, w->w_prot,
+                              c->score);
+  shared += score_float_range(c->avg_rating, n, c->avg_rating_min,
+                              c->avg_rating_max, prefs->rating_min,
+                              prefs->rating_max, w->w_rating, c->score);
+  return shared;
+}
+
+int parse_preferences(const char *filename, Preferences *prefs) {
   FILE *f = fopen(filename, "r");
   if (!f) {
     perror("Błąd pliku preferencji");
-    exit(1);
+    return 1;
   }
 
   char line[MAX_LINE];
@@ -324,115 +418,233 @@ void parse_preferences(const char *filename, Preferences *prefs) {
     }
   }
   fclose(f);
+  return 0;
 }
 
-int compare_recipes(const void *a, const void *b) {
-  Recipe *r1 = (Recipe *)a;
-  Recipe *r2 = (Recipe *)b;
-  if (r2->accuracy > r1->accuracy)
+void free_preferences(Preferences *prefs) {
+  free_string_array(prefs->ingredients_liked, prefs->liked_count);
+  free_string_array(prefs->ingredients_disliked, prefs->disliked_count);
+}
+
+int compare_matches(const void *a, const void *b) {
+  Match *m1 = (Match *)a;
+  Match *m2 = (Match *)b;
+  if (m2->accuracy > m1->accuracy)
     return 1;
-  if (r2->accuracy < r1->accuracy)
+  if (m2->accuracy < m1->accuracy)
     return -1;
   return 0;
 }
 
-int main(int argc, char *argv[]) {
-  if (argc != 5) {
-    printf(
-        "Użycie: %s <preferencje.json> <dane.csv> <wynik.json> <wagi.conf>\n",
-        argv[0]);
-    return 1;
-  }
-
-  Weights weights;
-  load_weights(argv[4], &weights);
-
-  Preferences prefs;
-  parse_preferences(argv[1], &prefs);
-
-  printf("✓ Wczytano cel: '%s'\n", prefs.recipe_name);
+int has_text_criteria(Preferences *prefs) {
+  return prefs->recipe_name[0] != '\0' || prefs->liked_count > 0 ||
+         prefs->disliked_count > 0;
+}
 
-  FILE *csv = fopen(argv[2], "r");
+// Poszerza zakres kolumny col o wiersz r.
+#define COLUMN_BOUNDS(c, col, r)                                               \
+  do {                                                                         \
+    if ((c)->col[r] < (c)->col##_min)                                          \
+      (c)->col##_min = (c)->col[r];                                            \
+    if ((c)->col[r] > (c)->col##_max)                                          \
+      (c)->col##_max = (c)->col[r];                                            \
+  } while (0)
+
+// Wczytuje CSV do kolumn. Przy keep_text == 0 pomija nazwy i składniki,
+// bo zapytanie bez kryteriów tekstowych ich nie potrzebuje.
+int load_recipes(const char *filename, RecipeColumns *recipes,
+                 int keep_text) {
+  FILE *csv = fopen(filename, "r");
   if (!csv) {
     perror("Błąd CSV");
     return 1;
   }
 
-  int recipe_capacity = 1000;
-  Recipe *recipes = malloc(recipe_capacity * sizeof(Recipe));
-  int recipe_count = 0;
+  columns_init(recipes, 1000);
 
   char line[MAX_LINE];
   fgets(line, sizeof(line), csv); // Header
 
   while (fgets(line, sizeof(line), csv)) {
-    if (recipe_count >= recipe_capacity) {
-      recipe_capacity *= 2;
-      recipes = realloc(recipes, recipe_capacity * sizeof(Recipe));
+    if (recipes->count >= recipes->capacity) {
+      columns_grow(recipes);
     }
-    Recipe *r = &recipes[recipe_count];
+    int r = recipes->count;
+    recipes->id[r] = 0;
+    recipes->avg_rating[r] = 0;
+    recipes->minutes[r] = 0;
+    recipes->cal[r] = 0;
+    recipes->prot[r] = 0;
+    recipes->fat[r] = 0;
 
     char *token = strtok(line, ",");
     int field = 0;
+    char name_clean[MAX_NAME] = "";
     char ingredients_str[MAX_LINE] = "";
-    char tags_str[MAX_LINE] = "";
 
     while (token != NULL) {
       switch (field) {
       case 0:
-        r->id = atoi(token);
+        recipes->id[r] = atoi(token);
         break;
       case 1:
-        r->avg_rating = atof(token);
-        break;
-      case 2:
-        r->review_count = atoi(token);
+        recipes->avg_rating[r] = atof(token);
         break;
       case 3:
-        r->minutes = atoi(token);
+        recipes->minutes[r] = atoi(token);
         break;
       case 4:
-        r->cal = atof(token);
+        recipes->cal[r] = atof(token);
         break;
       case 5:
-        r->prot = atof(token);
+        recipes->prot[r] = atof(token);
         break;
       case 6:
-        r->fat = atof(token);
+        recipes->fat[r] = atof(token);
         break;
       case 7:
-        strncpy(r->name_clean, token, MAX_NAME - 1);
+        strncpy(name_clean, token, MAX_NAME - 1);
         break;
       case 8:
         strncpy(ingredients_str, token, MAX_LINE - 1);
         break;
-      case 9:
-        strncpy(tags_str, token, MAX_LINE - 1);
-        break;
       }
       token = strtok(NULL, ",");
       field++;
     }
 
-    r->ingredients = split_string(ingredients_str, ";", &r->ingredients_count);
-    r->tags = split_string(tags_str, ";", &r->tags_count);
-    r->accuracy = calculate_accuracy(r, &prefs, &weights);
+    recipes->name[r] = NULL;
+    recipes->ingredients[r] = NULL;
+    recipes->ingredients_count[r] = 0;
+    if (keep_text) {
+      recipes->name[r] = strdup(name_clean);
+      recipes->ingredients[r] =
+          pack_ingredients(ingredients_str, &recipes->ingredients_count[r]);
+    }
+
+    if (r == 0) {
+      recipes->avg_rating_min = recipes->avg_rating[r];
+      recipes->avg_rating_max = recipes->avg_rating[r];
+      recipes->minutes_min = recipes->minutes_max = recipes->minutes[r];
+      recipes->cal_min = recipes->cal_max = recipes->cal[r];
+      recipes->prot_min = recipes->prot_max = recipes->prot[r];
+      recipes->fat_min = recipes->fat_max = recipes->fat[r];
+    }
+    COLUMN_BOUNDS(recipes, avg_rating, r);
+    COLUMN_BOUNDS(recipes, minutes, r);
+    COLUMN_BOUNDS(recipes, cal, r);
+    COLUMN_BOUNDS(recipes, prot, r);
+    COLUMN_BOUNDS(recipes, fat, r);
 
-    recipe_count++;
+    recipes->count++;
   }
   fclose(csv);
+  return 0;
+}
+
+// Liczy dopasowanie wszystkich przepisów i zapisuje 3 najlepsze do out_path.
+int run_query(RecipeColumns *recipes, Preferences *prefs, Weights *weights,
+              const char *out_path) {
+  // Bez nazwy i składników w zapytaniu nie ma czego liczyć per wiersz.
+  int text = has_text_criteria(prefs);
+  for (int i = 0; i < recipes->count; i++) {
+    recipes->score[i] =
+        text ? score_text_criteria(recipes->name[i], recipes->ingredients[i],
+                                   recipes->ingredients_count[i], prefs,
+                                   weights)
+             : 0.0;
+  }
+
+  float shared = score_range_criteria(recipes, prefs, weights);
+
+  float total = total_possible_score(prefs, weights);
+  Match *matches = malloc(recipes->count * sizeof(Match));
+  for (int i = 0; i < recipes->count; i++) {
+    matches[i].id = recipes->id[i];
+    matches[i].accuracy =
+        total > 0 ? (recipes->score[i] + shared) / total : 0.0;
+  }
 
-  qsort(recipes, recipe_count, sizeof(Recipe), compare_recipes);
+  qsort(matches, recipes->count, sizeof(Match), compare_matches);
 
-  FILE *output = fopen(argv[3], "w");
+  FILE *output = fopen(out_path, "w");
+  if (!output) {
+    perror("Błąd pliku wyników");
+    free(matches);
+    return 1;
+  }
   fprintf(output, "[\n");
-  for (int i = 0; i < 3 && i < recipe_count; i++) {
-    fprintf(output, "  {\"id\": %d, \"accuracy\": %.3f}%s\n", recipes[i].id,
-            recipes[i].accuracy, i < 2 ? "," : "");
+  for (int i = 0; i < 3 && i < recipes->count; i++) {
+    fprintf(output, "  {\"id\": %d, \"accuracy\": %.3f}%s\n", matches[i].id,
+            matches[i].accuracy, i < 2 ? "," : "");
   }
   fprintf(output, "]\n");
   fclose(output);
+  free(matches);
+  return 0;
+}
 
-  // Cleanup omitted for brevity (OS cleans up on exit anyway)
+// Tryb serwera: CSV wczytany raz, potem jedno zapytanie na linię stdin:
+// "<preferencje.json>\t<wynik.json>\t<wagi.conf>". Po każdym zapytaniu na
+// stdout idzie "ok" albo "error"; komunikaty diagnostyczne trafiają na
+// stderr, żeby nie mieszały się z odpowiedziami.
+int serve(const char *csv_path) {
+  FILE *reply = fdopen(dup(STDOUT_FILENO), "w");
+  dup2(STDERR_FILENO, STDOUT_FILENO);
+
+  RecipeColumns recipes;
+  if (load_recipes(csv_path, &recipes, 1) != 0)
+    return 1;
+
+  char line[MAX_LINE];
+  while (fgets(line, sizeof(line), stdin)) {
+    line[strcspn(line, "\n")] = '\0';
+    char *prefs_path = strtok(line, "\t");
+    char *out_path = strtok(NULL, "\t");
+    char *weights_path = strtok(NULL, "\t");
+
+    int ok = 0;
+    if (prefs_path && out_path && weights_path) {
+      Weights weights;
+      load_weights(weights_path, &weights);
+      Preferences prefs;
+      if (parse_preferences(prefs_path, &prefs) == 0) {
+        ok = run_query(&recipes, &prefs, &weights, out_path) == 0;
+        free_preferences(&prefs);
+      }
+    }
+    fflush(stdout);
+    fprintf(reply, ok ? "ok\n" : "error\n");
+    fflush(reply);
+  }
   return 0;
 }
+
+int main(int argc, char *argv[]) {
+  if (argc == 3 && strcmp(argv[1], "--serve") == 0) {
+    return serve(argv[2]);
+  }
+  if (argc != 5) {
+    printf(
+        "Użycie: %s <preferencje.json> <dane.csv> <wynik.json> <wagi.conf>\n"
+        "        %s --serve <dane.csv>\n",
+        argv[0], argv[0]);
+    return 1;
+  }
+
+  Weights weights;
+  load_weights(argv[4], &weights);
+
+  Preferences prefs;
+  if (parse_preferences(argv[1], &prefs) != 0)
+    return 1;
+
+  printf("✓ Wczytano cel: '%s'\n", prefs.recipe_name);
+
+  RecipeColumns recipes;
+  if (load_recipes(argv[2], &recipes, has_text_criteria(&prefs)) != 0)
+    return 1;
+
+  // Cleanup omitted for brevity (OS cleans up on exit anyway)
+  return run_query(&recipes, &prefs, &weights, argv[3]);
+}
@@ -0,0 +1,74 @@
+import os
+import shutil
+import time
+from pathlib import Path
+
+# gui.py builds widgets, which need a display; tests run without one.
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PySide6.QtWidgets import QApplication, QLabel
+
+import gui
+
+ROOT = Path(__file__).resolve().parent.parent
+DATA = Path(__file__).resolve().parent / "data"
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def data_paths(tmp_path, monkeypatch):
+    """Points gui's data and cache paths at copies of tests/data."""
+    for name in ("search_db.csv", "display_db.csv", "weights.conf"):
+        shutil.copy(DATA / name, tmp_path / name)
+    paths = {
+        "SEARCH_CSV": tmp_path / "search_db.csv",
+        "DISPLAY_CSV": tmp_path / "display_db.csv",
+        "WEIGHTS": tmp_path / "weights.conf",
+        "INGRIDIENTS_TRIE": tmp_path / "ingredients_trie.npz",
+        "RECIPES_FOUND": tmp_path / "recipes_found.json",
+        "RECIPE_DB_CACHE": tmp_path / "recipe_db.sqlite",
+        "USER_OUTPUT": tmp_path / "input.json",
+    }
+    for name, path in paths.items():
+        monkeypatch.setattr(gui, name, str(path))
+    return paths
+
+
+@pytest.fixture
+def make_window(qapp, data_paths, monkeypatch):
+    """Builds MainWindows on the test data and closes them on teardown."""
+    # on_search_press runs ./recipe_matcher from the working directory.
+    monkeypatch.chdir(ROOT)
+    monkeypatch.setattr(gui, "storage", gui.Storage())
+    windows = []
+
+    def make():
+        windows.append(gui.MainWindow())
+        return windows[-1]
+
+    yield make
+    for main_window in windows:
+        main_window.close()
+
+
+@pytest.fixture
+def window(make_window):
+    return make_window()
+
+
+def wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        QApplication.processEvents()
+        time.sleep(0.01)
+
+
+def label_texts(widget):
+    return [label.text() for label in widget.findChildren(QLabel)]
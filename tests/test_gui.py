@@ -0,0 +1,400 @@
+import ast
+import csv
+import json
+import os
+import sys
+
+import numpy as np
+import pytest
+from PySide6.QtCore import QPoint, Qt
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import QLineEdit, QPushButton
+
+import gui
+from conftest import DATA, label_texts, wait_until
+from gui import FloatingList, FlowScrollArea, TrieHandler
+
+CASES = json.loads((DATA / "matcher_cases.json").read_text())
+
+
+def _min_max_edits(window):
+    """(min, max) line edits per MIN_MAX_FILTERS row, in grid order."""
+    edits = window.findChildren(QLineEdit)
+    mins = [e for e in edits if e.placeholderText() == "Min"]
+    maxs = [e for e in edits if e.placeholderText() == "Max"]
+    return dict(
+        zip((key for _, key, *_ in window.MIN_MAX_FILTERS), zip(mins, maxs))
+    )
+
+
+def _search(window):
+    window.findChild(QPushButton, "searchButton").click()
+
+
+def _fill_ranges(window, preferences):
+    edits = _min_max_edits(window)
+    for key, (min_edit, max_edit) in edits.items():
+        QTest.keyClicks(min_edit, preferences.get(f"{key}_min", ""))
+        QTest.keyClicks(max_edit, preferences.get(f"{key}_max", ""))
+
+
+def _found_ids(data_paths):
+    with open(data_paths["RECIPES_FOUND"]) as f:
+        return [item["id"] for item in json.load(f)]
+
+
+@pytest.mark.parametrize(
+    "key, bound, text, label",
+    [
+        ("rating", 0, "7", "Rating (0-5)"),
+        ("minutes", 1, "20000", "Time (Minutes)"),
+        ("fat", 0, "10001", "Fat (g)"),
+    ],
+)
+def test_out_of_range_value_blocks_search(
+    window, data_paths, key, bound, text, label
+):
+    edit = _min_max_edits(window)[key][bound]
+    QTest.keyClicks(edit, text)
+    # The validator lets the digits through as Intermediate input.
+    assert edit.text() == text
+
+    _search(window)
+
+    assert f"Value out of range for: {label}" in label_texts(window)
+    assert not os.path.exists(data_paths["USER_OUTPUT"])
+
+
+def test_validator_blocks_non_numeric_input(window):
+    edit = _min_max_edits(window)["cal"][0]
+    QTest.keyClicks(edit, "12a")
+    assert edit.text() == "12"
+    QTest.keyClick(edit, Qt.Key.Key_Minus)
+    assert edit.text() == "12"
+
+
+def test_min_above_max_blocks_search(window, data_paths):
+    cal_min, cal_max = _min_max_edits(window)["cal"]
+    QTest.keyClicks(cal_min, "900")
+    QTest.keyClicks(cal_max, "100")
+
+    _search(window)
+
+    assert "Min is greater than max for: Calories" in label_texts(window)
+    assert not os.path.exists(data_paths["USER_OUTPUT"])
+
+
+def test_search_writes_matcher_results(window, data_paths):
+    case = CASES["tight_ranges"]
+    _fill_ranges(window, case["preferences"])
+
+    _search(window)
+
+    assert _found_ids(data_paths) == [r["id"] for r in case["expected"]]
+
+
+@pytest.mark.parametrize("changed", [None, "WEIGHTS", "SEARCH_CSV"])
+def test_query_cache_is_keyed_on_sources(
+    window, data_paths, monkeypatch, changed
+):
+    _fill_ranges(window, CASES["tight_ranges"]["preferences"])
+    _search(window)
+    found = data_paths["RECIPES_FOUND"]
+    first = found.read_bytes()
+
+    if changed:
+        source = data_paths[changed]
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    found.unlink()
+    # Closing stops the matcher server. Without ./recipe_matcher, only a
+    # cache hit can write the results.
+    window.close()
+    monkeypatch.chdir(data_paths["USER_OUTPUT"].parent)
+    _search(window)
+
+    if changed:
+        assert not found.exists()
+    else:
+        assert found.read_bytes() == first
+
+
+# Stands in for ./recipe_matcher: logs each launch, answers one-shot
+# queries with recipe 10 and, with --serve, does what SERVE_MODES says.
+FAKE_MATCHER = """#!{python}
+import sys
+with open("launches.log", "a") as log:
+    log.write(sys.argv[1] if sys.argv[1] == "--serve" else "once")
+    log.write("\\n")
+if sys.argv[1] == "--serve":
+    {serve}
+else:
+    with open(sys.argv[3], "w") as f:
+        f.write('[{{"id": 10, "accuracy": 1.0}}]')
+"""
+SERVE_MODES = {
+    # Reads requests until stdin closes but never replies.
+    "hang": "sys.stdin.read()",
+    # An old build: prints its usage and quits.
+    "reject": "print('Usage: recipe_matcher ...'); sys.exit(1)",
+}
+
+
+@pytest.mark.parametrize(
+    "mode, launches",
+    [
+        ("hang", ["--serve", "once", "--serve", "once"]),
+        ("reject", ["--serve", "once", "once"]),
+    ],
+)
+def test_matcher_server_failure_falls_back_to_one_shot(
+    window, data_paths, tmp_path, monkeypatch, mode, launches
+):
+    fake = tmp_path / "recipe_matcher"
+    fake.write_text(
+        FAKE_MATCHER.format(python=sys.executable, serve=SERVE_MODES[mode])
+    )
+    fake.chmod(0o755)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(window, "MATCHER_TIMEOUT", 0.5)
+    cal_min = _min_max_edits(window)["cal"][0]
+
+    for text in ("1", "2"):
+        QTest.keyClicks(cal_min, text)
+        _search(window)
+        assert _found_ids(data_paths) == [10]
+
+    log = tmp_path / "launches.log"
+    assert log.read_text().split() == launches
+
+
+@pytest.fixture
+def bubbles(qapp):
+    area = FlowScrollArea(height=None)
+    for text in ("salt", "salt", "olive oil"):
+        area.addItem(text)
+    canvas = area.widget()
+    area.resize(600, 200)
+    area.show()
+    QTest.qWaitForWindowExposed(area)
+    yield area, canvas
+    area.close()
+    area.deleteLater()
+
+
+def _close_button_span(canvas, y):
+    """Leftmost and rightmost x of the first close mark, found by hovering."""
+    hits = []
+    for x in range(canvas.width()):
+        QTest.mouseMove(canvas, QPoint(x, y))
+        if canvas.cursor().shape() == Qt.CursorShape.PointingHandCursor:
+            hits.append(x)
+        elif hits:
+            break
+    return hits[0], hits[-1]
+
+
+def test_bubbles_wrap_at_their_measured_width(bubbles):
+    area, canvas = bubbles
+    row = canvas.BUBBLE_HEIGHT
+    left, right = _close_button_span(canvas, row // 2)
+    assert right - left + 1 == canvas.CLOSE_SIZE
+    # Bubbles start at x=0 and end PADDING_X past their close mark.
+    width = right + canvas.PADDING_X + 1
+
+    spacing = 10
+    assert canvas.heightForWidth(10_000) == row
+    # The two "salt" bubbles share a row only if both fit with the gap.
+    assert canvas.heightForWidth(2 * width + spacing) == 2 * row + spacing
+    three_rows = 3 * row + 2 * spacing
+    assert canvas.heightForWidth(2 * width + spacing - 1) == three_rows
+
+
+def test_clicking_close_mark_removes_that_bubble(bubbles):
+    area, canvas = bubbles
+    y = canvas.BUBBLE_HEIGHT // 2
+    left, right = _close_button_span(canvas, y)
+    width = right + canvas.PADDING_X + 1
+
+    # The bubble body is not a button.
+    QTest.mouseClick(canvas, Qt.MouseButton.LeftButton, pos=QPoint(2, y))
+    assert area.items == ["salt", "salt", "olive oil"]
+
+    second_close = QPoint(width + 10 + (left + right) // 2, y)
+    QTest.mouseMove(canvas, second_close)
+    assert canvas.cursor().shape() == Qt.CursorShape.PointingHandCursor
+    QTest.mouseClick(canvas, Qt.MouseButton.LeftButton, pos=second_close)
+    assert area.items == ["salt", "olive oil"]
+    assert canvas.cursor().shape() == Qt.CursorShape.ArrowCursor
+
+
+def test_sharded_trie_build_matches_serial(tmp_path, monkeypatch):
+    def build(name):
+        path = tmp_path / name
+        TrieHandler(
+            str(path),
+            str(DATA / "search_db.csv"),
+            "id",
+            "ingredients_serialized",
+            ";",
+        )
+        with np.load(path) as data:
+            return {key: data[key] for key in data.files}
+
+    serial = build("serial.npz")
+    monkeypatch.setattr(gui, "TRIE_SHARD_MIN_ROWS", 10)
+    monkeypatch.setattr(gui.os, "cpu_count", lambda: 3)
+    sharded = build("sharded.npz")
+
+    assert serial.keys() == sharded.keys()
+    for key in serial:
+        np.testing.assert_array_equal(serial[key], sharded[key])
+
+
+# Recipe counts per ingredient, with ties so the alphabetical order of
+# equally common keys matters.
+TRIE_COUNTS = {
+    "salt": 9, "sage": 3, "saffron": 3, "salmon": 5, "salsa": 3,
+    "sugar": 7, "sumac": 1, "sultanas": 1, "s": 4, "Salami": 2,
+}
+
+
+@pytest.fixture
+def trie_handler(tmp_path):
+    path = tmp_path / "ingredients_trie.npz"
+    counts = list(TRIE_COUNTS.values())
+    np.savez(
+        path,
+        keys=np.array(list(TRIE_COUNTS)),
+        ids_off=np.concatenate([[0], np.cumsum(counts)]),
+        ids=np.arange(sum(counts)),
+    )
+    return TrieHandler(str(path))
+
+
+@pytest.mark.parametrize("prefix", ["sa", "su", "sal", "sals", "s", "x"])
+@pytest.mark.parametrize("limit", [2, 5, 20])
+def test_suggestions_rank_by_count_then_name(trie_handler, prefix, limit):
+    freq = {key.casefold(): count for key, count in TRIE_COUNTS.items()}
+    expected = sorted(
+        (key for key in freq if key.startswith(prefix)),
+        key=lambda key: (-freq[key], key),
+    )[:limit]
+
+    assert trie_handler.get_suggestions(prefix, limit) == tuple(expected)
+
+
+@pytest.fixture
+def floating_list(qapp):
+    view = FloatingList()
+    yield view
+    view.deleteLater()
+
+
+def _record_removals(view):
+    removed = []
+    view.model().rowsAboutToBeRemoved.connect(
+        lambda _parent, first, last: removed.append((first, last))
+    )
+    return removed
+
+
+def test_narrowed_suggestions_remove_rows_in_place(floating_list):
+    floating_list.update_items(["a", "b", "c", "d", "e", "f", "g"])
+    removed = _record_removals(floating_list)
+
+    floating_list.update_items(["b", "e"])
+
+    # Contiguous runs go back to front, so earlier rows keep their numbers.
+    assert removed == [(5, 6), (2, 3), (0, 0)]
+    assert floating_list.model().stringList() == ["b", "e"]
+
+
+def test_reordered_suggestions_reset_the_model(floating_list):
+    floating_list.update_items(["a", "b", "c"])
+    removed = _record_removals(floating_list)
+    resets = []
+    floating_list.model().modelReset.connect(lambda: resets.append(True))
+
+    floating_list.update_items(["c", "a"])
+
+    assert removed == []
+    assert resets == [True]
+    assert floating_list.model().stringList() == ["c", "a"]
+
+
+def _display_row(recipe_id):
+    with open(DATA / "display_db.csv", newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            if int(row["id"]) == recipe_id:
+                return row
+
+
+# Recipe 10 stores its lists as Python reprs, recipe 17 as JSON.
+@pytest.mark.parametrize("recipe_id", [10, 17])
+def test_detail_view_lists_ingredients_and_steps(window, recipe_id):
+    row = _display_row(recipe_id)
+    ingredients = ast.literal_eval(row["ingredients"])
+    steps = ast.literal_eval(row["steps"])
+    wait_until(lambda: len(window.recipe_db) == 30)
+
+    window.open_detail_view(recipe_id)
+
+    texts = label_texts(window)
+    assert row["name"] in texts
+    assert "\n".join(f"• {item}" for item in ingredients) in texts
+    assert "\n".join(f"{n}. {s}" for n, s in enumerate(steps, 1)) in texts
+
+
+def test_cold_load_swaps_in_the_recipe_cache(window, data_paths):
+    cache = data_paths["RECIPE_DB_CACHE"]
+    wait_until(cache.exists)
+
+    assert not os.path.exists(f"{cache}.tmp")
+    assert len(window.recipe_db) == 30
+    assert window.recipe_db.get(17)["name"] == _display_row(17)["name"]
+
+
+def test_second_window_opens_the_recipe_cache(make_window, data_paths):
+    make_window()
+    wait_until(data_paths["RECIPE_DB_CACHE"].exists)
+
+    # No event-loop turn: a warm start must not wait for the CSV import.
+    second = make_window()
+
+    assert len(second.recipe_db) == 30
+    assert second.recipe_db.get(17)["name"] == _display_row(17)["name"]
+
+
+def test_failed_csv_read_is_not_cached(make_window, data_paths):
+    with open(data_paths["DISPLAY_CSV"], "a", encoding="utf-8") as f:
+        f.write('999,"unterminated\n')
+    window = make_window()
+
+    # The display rows are lost with the failed chunk; the search rows
+    # still load for this session.
+    wait_until(lambda: len(window.recipe_db) == 30)
+    entry = window.recipe_db.get(10)
+    assert "name" not in entry
+    assert entry["minutes"]
+    assert not data_paths["RECIPE_DB_CACHE"].exists()
+
+
+def test_csvs_with_different_ids_merge_per_recipe(make_window, data_paths):
+    display = data_paths["DISPLAY_CSV"]
+    header, first, *rest = display.read_text(encoding="utf-8").splitlines(
+        keepends=True
+    )
+    # Without recipe 10 the paired chunks no longer share their ids.
+    assert first.startswith("10,")
+    display.write_text("".join([header, *rest]), encoding="utf-8")
+    window = make_window()
+
+    wait_until(lambda: len(window.recipe_db) == 30)
+
+    only_search = window.recipe_db.get(10)
+    assert "name" not in only_search
+    assert (only_search["rating"], only_search["minutes"]) == ("1.23", "40")
+    both = window.recipe_db.get(17)
+    assert both["name"] == _display_row(17)["name"]
+    assert both["minutes"]
@@ -0,0 +1,64 @@
+import json
+import subprocess
+
+import pytest
+
+from conftest import DATA, ROOT
+
+MATCHER = ROOT / "recipe_matcher"
+# Top-3 results of the matcher before the SoA rewrite, for the same input.
+CASES = json.loads((DATA / "matcher_cases.json").read_text())
+
+
+def run_matcher(tmp_path, preferences):
+    prefs = tmp_path / "input.json"
+    found = tmp_path / "recipes_found.json"
+    # One key/array item per line, as the GUI writes it.
+    prefs.write_text(json.dumps(preferences, indent=4))
+    subprocess.run(
+        [
+            MATCHER,
+            prefs,
+            DATA / "search_db.csv",
+            found,
+            DATA / "weights.conf",
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return json.loads(found.read_text())
+
+
+@pytest.mark.parametrize("case", sorted(CASES))
+def test_matches_baseline_output(tmp_path, case):
+    expected = CASES[case]["expected"]
+    assert run_matcher(tmp_path, CASES[case]["preferences"]) == expected
+
+
+def test_serve_answers_each_request(tmp_path):
+    server = subprocess.Popen(
+        [MATCHER, "--serve", DATA / "search_db.csv"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    try:
+        for case in sorted(CASES):
+            prefs = tmp_path / f"{case}.json"
+            found = tmp_path / f"{case}_found.json"
+            prefs.write_text(json.dumps(CASES[case]["preferences"], indent=4))
+            server.stdin.write(f"{prefs}\t{found}\t{DATA / 'weights.conf'}\n")
+            server.stdin.flush()
+            assert server.stdout.readline() == "ok\n"
+            assert json.loads(found.read_text()) == CASES[case]["expected"]
+
+        missing = tmp_path / "missing.json"
+        found = tmp_path / "missing_found.json"
+        server.stdin.write(f"{missing}\t{found}\t{DATA / 'weights.conf'}\n")
+        server.stdin.flush()
+        assert server.stdout.readline() == "error\n"
+        assert not found.exists()
+    finally:
+        server.stdin.close()
+        assert server.wait(timeout=5) == 0